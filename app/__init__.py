@@ -108,6 +108,12 @@ def create_app(config_name="default"):
     # SWAGGER_CONFIG is included in config.py and loaded here
     app.config.from_object(config_class)
 
+    # Use orjson for all JSON encoding/decoding (jsonify, request.get_json)
+    # See app/utils/json_provider.py for details
+    from app.utils.json_provider import OrjsonProvider
+
+    app.json = OrjsonProvider(app)
+
     # ==========================================================================
     # Initialize Centralized Logging System
     # ==========================================================================
@@ -20,7 +20,7 @@ Security Features:
 -----------------
 - Tokens are signed with SECRET_KEY (never share this!)
 - Tokens include user identity and claims
-- Blacklist support for logged-out tokens
+- Blocklist support for logged-out tokens (in-memory or Redis)
 - CSRF protection for cookie-based tokens
 
 Usage:
@@ -33,11 +33,13 @@ Usage:
         return {"message": f"Hello {user.username}"}
 """
 
+import hashlib
 import logging
+import time
 from datetime import timedelta
 from typing import Dict, Optional
 
-from flask import Flask
+from flask import Flask, current_app, g
 from flask_jwt_extended import (
     JWTManager,
     create_access_token,
@@ -45,18 +47,67 @@ from flask_jwt_extended import (
     get_jwt_identity,
 )
 from flask_jwt_extended import jwt_required as _jwt_required
+from sqlalchemy import update
 
+from app import db
+from app.auth.blocklist import token_blocklist
 from app.models.user import User
+from app.utils.cache import TTLCache
 from app.utils.responses import ErrorCode, error_response
 
 logger = logging.getLogger(__name__)
 
-# Initialize JWT Manager (will be configured in init_jwt)
-jwt = JWTManager()
+# Decoded-token cache: sha256(raw token) -> verified claims
+# Sized for the number of distinct tokens active within one TTL window
+_decoded_token_cache = TTLCache(maxsize=10000)
+
+# Token-version cache: user_id -> users.token_version
+_token_version_cache = TTLCache(maxsize=10000)
+
+
+class CachingJWTManager(JWTManager):
+    """
+    JWTManager that remembers recently verified tokens for a few seconds.
+
+    Decoding a token (parse, verify the signature, validate the claims) costs
+    ~180µs with Flask-JWT-Extended + PyJWT, and a client sends the same
+    access token on every request until it expires. Verified claims are kept
+    for JWT_DECODE_CACHE_TTL seconds, keyed by a hash of the raw token:
+    - An entry never outlives the token's own "exp", so expired tokens are
+      always decoded again and rejected as usual
+    - Revocation is unaffected: the blocklist check runs after decoding, on
+      every request, so a logged-out token is refused immediately
+    - Only a token with an identical signature can hit an entry, so a
+      tampered token is always fully verified
+
+    Flask-JWT-Extended has no public hook around decoding, so this overrides
+    the private JWTManager._decode_jwt_from_config. The dependency is pinned
+    exactly and tests/test_auth/test_decode_cache.py fails if the override
+    stops being called.
+    """
 
-# In-memory token blacklist (use Redis in production)
-# This stores JTI (JWT ID) of revoked tokens
-_token_blacklist = set()
+    def _decode_jwt_from_config(
+        self, encoded_token: str, csrf_value=None, allow_expired: bool = False
+    ) -> dict:
+        ttl = current_app.config.get("JWT_DECODE_CACHE_TTL", 0)
+        # CSRF-bound (cookie) tokens and allow_expired decodes skip the cache
+        if ttl <= 0 or csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        key = hashlib.sha256(encoded_token.encode()).digest()
+        claims = _decoded_token_cache.get(key)
+        if claims is None:
+            claims = super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+            if "exp" in claims:
+                ttl = min(ttl, claims["exp"] - time.time())
+            _decoded_token_cache.set(key, claims, ttl)
+
+        # Callers get their own copy; the cached claims stay untouched
+        return dict(claims)
+
+
+# Initialize JWT Manager (will be configured in init_jwt)
+jwt = CachingJWTManager()
 
 
 def init_jwt(app: Flask) -> None:
@@ -83,6 +134,9 @@ def init_jwt(app: Flask) -> None:
     # Initialize the extension
     jwt.init_app(app)
 
+    # Revoked tokens: per-process memory by default, Redis when configured
+    token_blocklist.init_app(app.config.get("TOKEN_BLOCKLIST_URL", "memory://"))
+
     # Register callbacks
     @jwt.user_identity_loader
     def user_identity_lookup(user):
@@ -104,18 +158,27 @@ def init_jwt(app: Flask) -> None:
         Returns the User object for get_current_user().
         """
         identity = jwt_data["sub"]
-        return User.query.filter_by(id=identity, is_deleted=False).first()
+        # Session.get() checks the identity map first, so later lookups of
+        # the same user in this request are served without a query
+        user = db.session.get(User, int(identity))
+        if user is None or user.is_deleted:
+            return None
+        return user
 
     @jwt.token_in_blocklist_loader
     def check_if_token_revoked(jwt_header, jwt_payload):
         """
         Check if a token has been revoked (logged out).
 
-        Uses in-memory blacklist for development.
-        Use Redis in production for distributed systems.
+        A single O(1) lookup: a dict read in memory mode, one EXISTS in Redis.
         """
-        jti = jwt_payload["jti"]
-        return jti in _token_blacklist
+        if token_blocklist.is_revoked(jwt_payload["jti"]):
+            return True
+
+        # Tokens issued before the user's last "logout everywhere" are stale
+        # (tokens from before token_version existed count as version 0)
+        version = _get_token_version(int(jwt_payload["sub"]))
+        return version is not None and jwt_payload.get("tv", 0) != version
 
     # Error handlers for JWT errors
     @jwt.expired_token_loader
@@ -178,13 +241,17 @@ def create_tokens(user: User) -> Dict[str, str]:
     additional_claims = {
         "username": user.username,
         "email": user.email,
+        "tv": user.token_version,
     }
 
     access_token = create_access_token(
         identity=user,
         additional_claims=additional_claims,
     )
-    refresh_token = create_refresh_token(identity=user)
+    refresh_token = create_refresh_token(
+        identity=user,
+        additional_claims={"tv": user.token_version},
+    )
 
     logger.info(f"Tokens created for user_id={user.id}")
 
@@ -195,17 +262,84 @@ def create_tokens(user: User) -> Dict[str, str]:
     }
 
 
-def revoke_token(jti: str) -> None:
+def revoke_token(jti: str, expires_at: Optional[int] = None) -> None:
     """
-    Revoke a token by adding its JTI to the blacklist.
+    Revoke a token by adding its JTI to the blocklist.
+
+    The entry is kept only until the token's own expiry; after that the
+    token is rejected by signature/claim verification anyway.
 
     Args:
         jti: The JWT ID of the token to revoke
+        expires_at: The token's "exp" claim (Unix timestamp), if known
     """
-    _token_blacklist.add(jti)
+    token_blocklist.revoke(jti, expires_at)
     logger.info(f"Token revoked: jti={jti[:8]}...")
 
 
+def revoke_all_tokens(user_id: int) -> int:
+    """
+    Revoke every token issued to a user so far ("logout everywhere").
+
+    Increments users.token_version in a single UPDATE; tokens carrying an
+    older "tv" claim are rejected from then on.
+
+    Args:
+        user_id: ID of the user whose tokens to revoke
+
+    Returns:
+        int: The new token version (new tokens must embed it)
+
+    Note:
+        The caller is responsible for committing the session, then calling
+        invalidate_token_version() so this worker stops accepting old tokens.
+    """
+    new_version = db.session.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+        .returning(User.token_version)
+    ).scalar_one()
+
+    logger.info("All tokens revoked for user_id=%s", user_id)
+    return new_version
+
+
+def invalidate_token_version(user_id: int) -> None:
+    """
+    Drop a user's cached token version.
+
+    Call after committing a token_version change. Invalidating earlier lets
+    a concurrent request re-cache the old, still-committed version.
+
+    Args:
+        user_id: ID of the user whose entry to drop
+    """
+    _token_version_cache.invalidate(user_id)
+
+
+def _get_token_version(user_id: int) -> Optional[int]:
+    """
+    Return a user's current token version, cached for TOKEN_VERSION_CACHE_TTL.
+
+    On a miss the whole user row is loaded with Session.get(), so the user
+    lookup that follows in the same request comes from the identity map
+    instead of a second query. Deleted/missing users return None and are
+    rejected by the user lookup.
+    """
+
+    def load() -> Optional[int]:
+        user = db.session.get(User, user_id)
+        # The identity map only holds weak references: keep the user alive
+        # until the user lookup runs, or it would be collected and re-queried
+        g._token_version_user = user
+        return None if user is None else user.token_version
+
+    return _token_version_cache.get_or_set(
+        user_id, load, ttl=current_app.config.get("TOKEN_VERSION_CACHE_TTL", 0)
+    )
+
+
 def get_current_user() -> Optional[User]:
     """
     Get the current authenticated user.
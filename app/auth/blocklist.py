@@ -0,0 +1,160 @@
+"""
+Token Blocklist - Where revoked (logged-out) tokens are remembered.
+
+Every request to a protected endpoint asks "has this token been revoked?",
+so the check has to be cheap. Revoked tokens only need to be remembered
+until they expire on their own - after that the JWT signature check already
+rejects them.
+
+Storage Backends:
+-----------------
+The backend is chosen by TOKEN_BLOCKLIST_URL, like RATELIMIT_STORAGE_URL:
+
+- memory://                      (default) A dict in each worker process.
+                                 Fine for development and single-process
+                                 servers, but a logout is only seen by the
+                                 worker that handled it and is lost on restart.
+- redis://localhost:6379/0       Shared across workers and hosts, survives
+                                 restarts. Requires the `redis` package.
+
+Redis Layout:
+-------------
+    SET auth:revoked:<jti> 1 EX <seconds until the token's exp> NX
+    EXISTS auth:revoked:<jti>
+
+Redis drops each key by itself when the token would have expired anyway, so
+the blocklist never grows beyond the set of live, revoked tokens.
+
+Usage:
+    from app.auth.blocklist import token_blocklist
+
+    token_blocklist.revoke(jti, expires_at=payload["exp"])
+    token_blocklist.is_revoked(jti)
+"""
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    import redis
+
+logger = logging.getLogger(__name__)
+
+# Key prefix for revoked JTIs in Redis
+REVOKED_KEY_PREFIX = "auth:revoked:"
+
+# How long to remember a token whose expiry is unknown (refresh token lifetime)
+DEFAULT_REVOKE_TTL = 30 * 24 * 3600
+
+
+class MemoryBlocklist:
+    """
+    In-process blocklist: jti -> expiry timestamp.
+
+    Expired entries are purged whenever a token is revoked, so the dict only
+    holds tokens that could still pass signature verification.
+    """
+
+    def __init__(self):
+        self._revoked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, ttl: int) -> None:
+        now = time.time()
+        with self._lock:
+            for key in [k for k, expires in self._revoked.items() if expires <= now]:
+                del self._revoked[key]
+            self._revoked[jti] = now + ttl
+
+    def is_revoked(self, jti: str) -> bool:
+        expires = self._revoked.get(jti)
+        return expires is not None and expires > time.time()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._revoked.clear()
+
+
+class RedisBlocklist:
+    """
+    Redis-backed blocklist shared by every worker.
+
+    Uses a single client (with its own connection pool) per process; each
+    check is one EXISTS round-trip.
+    """
+
+    def __init__(self, url: str):
+        # Imported lazily: redis is only needed when a redis:// URL is configured
+        import redis
+
+        self._client: "redis.Redis" = redis.Redis.from_url(
+            url, socket_connect_timeout=5, socket_timeout=5
+        )
+
+    def revoke(self, jti: str, ttl: int) -> None:
+        self._client.set(f"{REVOKED_KEY_PREFIX}{jti}", b"1", ex=ttl, nx=True)
+
+    def is_revoked(self, jti: str) -> bool:
+        return bool(self._client.exists(f"{REVOKED_KEY_PREFIX}{jti}"))
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match=f"{REVOKED_KEY_PREFIX}*"):
+            self._client.delete(key)
+
+
+class TokenBlocklist:
+    """
+    Facade over the configured backend.
+
+    Starts with the in-memory backend so it works before init_app() is
+    called (e.g., in scripts); init_app() switches to the configured URL.
+    """
+
+    def __init__(self):
+        self._backend = MemoryBlocklist()
+
+    def init_app(self, url: str) -> None:
+        """
+        Select the storage backend.
+
+        Args:
+            url: "memory://" or a redis:// / rediss:// URL
+        """
+        if url.startswith(("redis://", "rediss://", "unix://")):
+            self._backend = RedisBlocklist(url)
+            logger.info("Token blocklist: Redis")
+        else:
+            self._backend = MemoryBlocklist()
+            logger.info("Token blocklist: in-memory (per process)")
+
+    def revoke(self, jti: str, expires_at: Optional[int] = None) -> None:
+        """
+        Revoke a token until it expires.
+
+        Args:
+            jti: The JWT ID of the token
+            expires_at: The token's "exp" claim (Unix timestamp). If omitted,
+                the token is remembered for DEFAULT_REVOKE_TTL seconds.
+        """
+        if expires_at is None:
+            ttl = DEFAULT_REVOKE_TTL
+        else:
+            ttl = int(expires_at) - int(time.time())
+            if ttl <= 0:
+                # Already expired - signature verification rejects it anyway
+                return
+        self._backend.revoke(jti, ttl)
+
+    def is_revoked(self, jti: str) -> bool:
+        """Return True if the token with this JTI has been revoked."""
+        return self._backend.is_revoked(jti)
+
+    def clear(self) -> None:
+        """Forget all revoked tokens (used by tests)."""
+        self._backend.clear()
+
+
+# Process-wide blocklist (configured in init_jwt)
+token_blocklist = TokenBlocklist()
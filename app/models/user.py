@@ -13,13 +13,46 @@ This model includes relationships for Role-Based Access Control:
 Effective permissions = Role Permissions + Direct Permissions
 """
 
-from sqlalchemy import Boolean, Column, String, Text
+from typing import AbstractSet
+
+from sqlalchemy import Boolean, Column, Integer, String, Text
 from sqlalchemy.orm import relationship
+from werkzeug.security import check_password_hash, generate_password_hash
 
 from app.models.associations import user_permissions, user_roles
 from app.models.base import BaseModel
 
 
+def matches_permission(granted: AbstractSet[str], permission_name: str) -> bool:
+    """
+    Check whether a set of granted permissions covers `permission_name`.
+
+    Handles exact matches and the two wildcard forms: "*:*" (everything) and
+    "resource:*" (every action on one resource). Each is a single set lookup,
+    so the check is O(1) however many permissions the user holds.
+    Shared by User.has_permission and RBACService, which checks against a
+    cached permission set instead of recomputing it.
+
+    Args:
+        granted: Permission names the user has
+        permission_name: Permission to check (e.g., "users:delete")
+
+    Returns:
+        bool: True if the permission is granted
+    """
+    # Exact match
+    if permission_name in granted:
+        return True
+
+    # Wildcard: super admin (*:*)
+    if "*:*" in granted:
+        return True
+
+    # Wildcard: resource-level (e.g., users:*)
+    resource, sep, _ = permission_name.partition(":")
+    return bool(sep) and f"{resource}:*" in granted
+
+
 class User(BaseModel):
     """
     User model representing the users table in PostgreSQL.
@@ -61,6 +94,13 @@ class User(BaseModel):
     # Note: is_deleted is inherited from BaseModel
     is_active = Column(Boolean, default=True)
 
+    # ========================================================================
+    # TOKEN VERSION
+    # ========================================================================
+    # Embedded in every JWT as the "tv" claim. Incrementing it ("logout
+    # everywhere") invalidates all tokens issued before, in one UPDATE.
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     # ========================================================================
     # RBAC RELATIONSHIPS
     # ========================================================================
@@ -186,23 +226,7 @@ class User(BaseModel):
                 # User can delete users
                 pass
         """
-        all_perms = self.get_all_permissions()
-
-        # Exact match
-        if permission_name in all_perms:
-            return True
-
-        # Wildcard: super admin (*:*)
-        if "*:*" in all_perms:
-            return True
-
-        # Wildcard: resource-level (e.g., users:*)
-        if ":" in permission_name:
-            resource, _ = permission_name.split(":", 1)
-            if f"{resource}:*" in all_perms:
-                return True
-
-        return False
+        return matches_permission(self.get_all_permissions(), permission_name)
 
     def has_role(self, role_name: str) -> bool:
         """
@@ -251,11 +275,18 @@ class User(BaseModel):
         """
         Hash a password for storing using secure werkzeug functions.
 
-        Uses PBKDF2 with SHA-256 by default, which is:
+        Uses scrypt by default (werkzeug >= 3.0), which is:
         - Slow by design (resistant to brute-force)
+        - Memory-hard (resistant to GPU/ASIC cracking)
         - Automatically salted (resistant to rainbow tables)
         - Industry standard for password hashing
 
+        Concurrency Note:
+            The work happens inside hashlib (OpenSSL), which releases the GIL
+            while hashing. Other threads of the same gunicorn worker
+            (--threads) keep serving requests during a login/register burst,
+            so there's no need to push hashing to a separate process pool.
+
         Args:
             password: The plain text password to hash
 
@@ -264,10 +295,8 @@ class User(BaseModel):
 
         Example:
             >>> User.hash_password("MySecurePass123")
-            'pbkdf2:sha256:600000$...$...'
+            'scrypt:32768:8:1$...$...'
         """
-        from werkzeug.security import generate_password_hash
-
         return generate_password_hash(password)
 
     def check_password(self, password: str) -> bool:
@@ -284,8 +313,6 @@ class User(BaseModel):
         Returns:
             bool: True if password matches, False otherwise
         """
-        from werkzeug.security import check_password_hash
-
         return check_password_hash(self.password_hash, password)
 
     def set_password(self, password: str) -> None:
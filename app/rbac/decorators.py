@@ -51,7 +51,9 @@ from functools import wraps
 
 from flask_jwt_extended import verify_jwt_in_request
 
-from app.auth import get_current_user
+# Import the module, not the function: app.auth imports app.utils, whose error
+# handlers import this package, so app.auth can still be initializing here
+from app import auth
 from app.rbac.services import RBACService
 from app.utils.responses import ErrorCode, error_response
 
@@ -88,7 +90,7 @@ def _verify_authenticated_user():
         )
 
     # Step 2: Get current user
-    user = get_current_user()
+    user = auth.get_current_user()
     if user is None:
         return None, error_response(
             code=ErrorCode.UNAUTHORIZED,
@@ -157,6 +159,9 @@ def permission_required(
                  401 Error     401 Error       403 Error (if fails)
     """
 
+    # Built once at decoration time, not on every request
+    required = frozenset(permissions)
+
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
@@ -167,9 +172,9 @@ def permission_required(
 
             # Check permissions
             if require_all:
-                has_access = RBACService.user_has_all_permissions(user, list(permissions))
+                has_access = RBACService.user_has_all_permissions(user, required)
             else:
-                has_access = RBACService.user_has_any_permission(user, list(permissions))
+                has_access = RBACService.user_has_any_permission(user, required)
 
             if not has_access:
                 logger.info(
@@ -336,7 +341,7 @@ def check_permission(permission: str) -> bool:
 
             return user_data
     """
-    user = get_current_user()
+    user = auth.get_current_user()
     if user is None:
         return False
     return RBACService.user_has_permission(user, permission)
@@ -352,7 +357,7 @@ def check_role(role: str) -> bool:
     Returns:
         bool: True if current user has the role
     """
-    user = get_current_user()
+    user = auth.get_current_user()
     if user is None:
         return False
     return RBACService.user_has_role(user, role)
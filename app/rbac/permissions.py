@@ -290,3 +290,38 @@ class PermissionRegistry:
         Useful for admin UI lists.
         """
         return [{"name": name, "description": desc} for name, desc in cls.PERMISSIONS.items()]
+
+    @classmethod
+    def parsed_permissions(cls) -> List[Dict[str, str]]:
+        """
+        Get all permissions pre-split into resource and action.
+
+        The registry is constant, so the parsing is done once at import time
+        (see _PARSED_PERMISSIONS below) and every caller reuses the result.
+
+        Returns:
+            List of dicts with 'name', 'resource', 'action' and 'description'
+            keys, ready to be used as Permission insert rows.
+
+        Example:
+            {"name": "users:delete", "resource": "users", "action": "delete",
+             "description": "Delete user accounts (soft delete)"}
+        """
+        return _PARSED_PERMISSIONS
+
+
+def _parse_permission(name: str, description: str) -> Dict[str, str]:
+    """Split a "resource:action" name into a Permission row (no ':' → action '*')."""
+    resource, _, action = name.partition(":")
+    return {
+        "name": name,
+        "resource": resource,
+        "action": action if action else "*",
+        "description": description,
+    }
+
+
+# Parsed once at import time - the registry never changes at runtime
+_PARSED_PERMISSIONS: List[Dict[str, str]] = [
+    _parse_permission(name, desc) for name, desc in PermissionRegistry.PERMISSIONS.items()
+]
@@ -29,10 +29,16 @@ Usage:
 """
 
 import logging
-from typing import List, Optional, Set, Tuple
+from typing import FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from flask import current_app
+from sqlalchemy import bindparam, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload
 
 from app import db
-from app.models import Permission, Role, User
+from app.models import Permission, Role, User, role_permissions, user_permissions, user_roles
+from app.models.user import matches_permission
 from app.rbac.exceptions import (
     DirectPermissionError,
     PermissionDeniedError,
@@ -42,9 +48,36 @@ from app.rbac.exceptions import (
     SystemRoleError,
 )
 from app.rbac.permissions import PermissionRegistry
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# PREBUILT STATEMENTS
+# =============================================================================
+# Hot name lookups are built once at import time with a bind parameter.
+# Every call reuses the same statement object, so SQLAlchemy's compiled-SQL
+# cache is hit immediately instead of rebuilding the query each time.
+
+_ROLE_BY_NAME_STMT = select(Role).where(Role.name == bindparam("name"), Role.is_deleted.is_(False))
+
+_PERMISSION_BY_NAME_STMT = select(Permission).where(
+    Permission.name == bindparam("name"), Permission.is_deleted.is_(False)
+)
+
+# =============================================================================
+# CACHE
+# =============================================================================
+# Process-local cache for read-heavy RBAC data (role and permission lists,
+# effective permissions per user).
+# Keys are prefixed so related entries can be invalidated together.
+
+rbac_cache = TTLCache(maxsize=256)
+
+ROLE_LIST_CACHE_PREFIX = "role:list:"
+PERMISSION_LIST_CACHE_PREFIX = "perm:list:"
+USER_PERMISSIONS_CACHE_PREFIX = "user:perms:"
+
 
 class RBACService:
     """
@@ -83,7 +116,7 @@ class RBACService:
         if user is None:
             return False
 
-        return user.has_permission(permission)
+        return matches_permission(RBACService.get_effective_permissions(user), permission)
 
     @staticmethod
     def user_has_role(user: User, role_name: str) -> bool:
@@ -103,13 +136,13 @@ class RBACService:
         return user.has_role(role_name)
 
     @staticmethod
-    def user_has_any_permission(user: User, permissions: List[str]) -> bool:
+    def user_has_any_permission(user: User, permissions: Iterable[str]) -> bool:
         """
         Check if user has ANY of the specified permissions.
 
         Args:
             user: The User object to check
-            permissions: List of permission strings
+            permissions: Permission strings (a frozenset is fastest)
 
         Returns:
             bool: True if user has at least one permission
@@ -117,16 +150,22 @@ class RBACService:
         if user is None:
             return False
 
-        return any(user.has_permission(perm) for perm in permissions)
+        granted = RBACService.get_effective_permissions(user)
+
+        # Fast path: one C-level set intersection test covers exact grants;
+        # wildcard matching only runs when that fails
+        if not granted.isdisjoint(permissions):
+            return True
+        return any(matches_permission(granted, perm) for perm in permissions)
 
     @staticmethod
-    def user_has_all_permissions(user: User, permissions: List[str]) -> bool:
+    def user_has_all_permissions(user: User, permissions: Iterable[str]) -> bool:
         """
         Check if user has ALL of the specified permissions.
 
         Args:
             user: The User object to check
-            permissions: List of permission strings
+            permissions: Permission strings (a frozenset is fastest)
 
         Returns:
             bool: True if user has all permissions
@@ -134,7 +173,12 @@ class RBACService:
         if user is None:
             return False
 
-        return all(user.has_permission(perm) for perm in permissions)
+        granted = RBACService.get_effective_permissions(user)
+
+        # Fast path: a C-level subset test covers users granted every name exactly
+        if granted.issuperset(permissions):
+            return True
+        return all(matches_permission(granted, perm) for perm in permissions)
 
     @staticmethod
     def get_user_permissions(user: User) -> Set[str]:
@@ -154,7 +198,89 @@ class RBACService:
         if user is None:
             return set()
 
-        return user.get_all_permissions()
+        return set(RBACService.get_effective_permissions(user))
+
+    @staticmethod
+    def get_effective_permissions(user: User) -> FrozenSet[str]:
+        """
+        Get a user's effective permissions, cached per user.
+
+        Computing the effective set walks every role, its parent chain and the
+        direct permissions - several queries on every protected request. The
+        result is cached for RBAC_CACHE_TTL seconds (off by default) and
+        dropped whenever the user's roles, direct permissions or any role
+        definition change. Invalidation only reaches this worker: other
+        workers keep their copy until it expires.
+
+        Args:
+            user: The User object
+
+        Returns:
+            FrozenSet[str]: Permission names (role-based + direct)
+        """
+        return rbac_cache.get_or_set(
+            f"{USER_PERMISSIONS_CACHE_PREFIX}{user.id}",
+            lambda: frozenset(user.get_all_permissions()),
+            ttl=current_app.config.get("RBAC_CACHE_TTL", 0),
+        )
+
+    @staticmethod
+    def get_user_permission_names(user_id: int) -> List[str]:
+        """
+        Get a user's effective permission names straight from the database.
+
+        Same result as user.get_all_permissions(), but resolved in one query
+        instead of walking roles, parent roles and direct permissions as ORM
+        objects:
+
+            WITH RECURSIVE role_tree(role_id) AS (
+                SELECT role_id FROM user_roles WHERE user_id = :user_id
+                UNION
+                SELECT r.parent_role_id FROM roles r JOIN role_tree ON r.id = role_tree.role_id
+                WHERE r.parent_role_id IS NOT NULL
+            )
+            SELECT p.name FROM permissions p
+            JOIN role_permissions rp ON rp.permission_id = p.id
+            JOIN role_tree ON role_tree.role_id = rp.role_id
+            UNION
+            SELECT p.name FROM permissions p
+            JOIN user_permissions up ON up.permission_id = p.id
+            WHERE up.user_id = :user_id
+            ORDER BY name
+
+        UNION (not UNION ALL) removes duplicates in PostgreSQL and also stops
+        the recursion if a role hierarchy ever contains a cycle.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            List[str]: Sorted, de-duplicated permission names
+        """
+        role_tree = (
+            select(user_roles.c.role_id.label("role_id"))
+            .where(user_roles.c.user_id == user_id)
+            .cte("role_tree", recursive=True)
+        )
+        role_tree = role_tree.union(
+            select(Role.parent_role_id)
+            .join(role_tree, Role.id == role_tree.c.role_id)
+            .where(Role.parent_role_id.is_not(None))
+        )
+
+        from_roles = (
+            select(Permission.name)
+            .join(role_permissions, role_permissions.c.permission_id == Permission.id)
+            .join(role_tree, role_tree.c.role_id == role_permissions.c.role_id)
+        )
+        direct = (
+            select(Permission.name)
+            .join(user_permissions, user_permissions.c.permission_id == Permission.id)
+            .where(user_permissions.c.user_id == user_id)
+        )
+
+        stmt = from_roles.union(direct).order_by("name")
+        return list(db.session.scalars(stmt))
 
     @staticmethod
     def get_user_roles(user: User) -> List[Role]:
@@ -172,6 +298,112 @@ class RBACService:
 
         return list(user.roles)
 
+    @staticmethod
+    def get_user_with_permission_graph(user_id: int) -> Optional[User]:
+        """
+        Get an active user with everything needed to inspect their access.
+
+        Endpoints that show a user's roles and permissions touch user.roles,
+        each role's permissions, the parent-role chain and the direct
+        permissions. Loaded lazily, that's a query per role (and per parent);
+        here every level is fetched with one "WHERE id IN (...)" query, so
+        the count depends on hierarchy depth, not on the number of roles.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            User with roles, role permissions, parent roles and direct
+            permissions loaded, or None if not found / soft-deleted
+        """
+        return (
+            User.query.options(
+                selectinload(User.roles).selectinload(Role.permissions),
+                selectinload(User.roles).selectinload(Role.parent_role, recursion_depth=-1),
+                selectinload(User.direct_permissions),
+            )
+            .filter_by(id=user_id, is_deleted=False)
+            .first()
+        )
+
+    @staticmethod
+    def list_users_with_roles(limit: int = 20, offset: int = 0) -> List[User]:
+        """
+        Get a page of active users with their roles and permissions preloaded.
+
+        Listing users and then touching user.roles / role.permissions one by one
+        causes the classic N+1 problem. selectinload fetches each collection for
+        the whole page with a single "WHERE id IN (...)" query instead:
+
+            1 query for the users
+            1 query for all of their roles
+            1 query for all of those roles' permissions
+
+        Args:
+            limit: Maximum number of users to return
+            offset: Number of users to skip (for pagination)
+
+        Returns:
+            List[User]: Users ordered by ID, with roles and permissions loaded
+        """
+        return (
+            User.query.options(selectinload(User.roles).selectinload(Role.permissions))
+            .filter_by(is_deleted=False)
+            .order_by(User.id)
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
+
+    @staticmethod
+    def count_user_roles(user_id: int) -> int:
+        """
+        Count the roles assigned to a user without loading any Role objects.
+
+        Counts rows in the user_roles association table directly, which is
+        much cheaper than len(user.roles) when only the number is needed
+        (e.g., badges or summaries in the UI).
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            int: Number of roles assigned to the user
+        """
+        return (
+            db.session.query(func.count())
+            .select_from(user_roles)
+            .filter(user_roles.c.user_id == user_id)
+            .scalar()
+        )
+
+    @staticmethod
+    def role_name_set(user_id: int) -> Set[str]:
+        """
+        Get the names of a user's roles with a single-column query.
+
+        Selects only rbac.roles.name (joined through user_roles), so no ORM
+        Role objects or their permissions are constructed. Use this for
+        membership checks when the full Role objects aren't needed.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            Set[str]: Role names assigned to the user
+
+        Example:
+            if "admin" in RBACService.role_name_set(user.id):
+                ...
+        """
+        rows = (
+            db.session.query(Role.name)
+            .join(user_roles, user_roles.c.role_id == Role.id)
+            .filter(user_roles.c.user_id == user_id)
+            .all()
+        )
+        return {name for (name,) in rows}
+
     # =========================================================================
     # ROLE MANAGEMENT
     # =========================================================================
@@ -187,7 +419,7 @@ class RBACService:
         Returns:
             Role object or None if not found
         """
-        return Role.query.filter_by(name=role_name, is_deleted=False).first()
+        return db.session.execute(_ROLE_BY_NAME_STMT, {"name": role_name}).scalar_one_or_none()
 
     @staticmethod
     def get_role_by_id(role_id: int) -> Optional[Role]:
@@ -199,8 +431,15 @@ class RBACService:
 
         Returns:
             Role object or None if not found
+
+        Note:
+            Session.get() serves the role from the identity map when it's
+            already loaded (e.g., via a user's roles) without a query.
         """
-        return Role.query.filter_by(id=role_id, is_deleted=False).first()
+        role = db.session.get(Role, role_id)
+        if role is None or role.is_deleted:
+            return None
+        return role
 
     @staticmethod
     def get_role_or_404(role_name: str = None, role_id: int = None) -> Role:
@@ -259,6 +498,7 @@ class RBACService:
         # Assign the role
         user.roles.append(role)
         db.session.commit()
+        RBACService.invalidate_user_permissions(user.id)
 
         logger.info(
             f"Role '{role_name}' assigned to user_id={user.id} "
@@ -299,6 +539,7 @@ class RBACService:
         # Revoke the role
         user.roles.remove(role)
         db.session.commit()
+        RBACService.invalidate_user_permissions(user.id)
 
         logger.info(
             f"Role '{role_name}' revoked from user_id={user.id} "
@@ -312,7 +553,7 @@ class RBACService:
         name: str,
         display_name: str,
         description: Optional[str] = None,
-        permission_names: Optional[List[str]] = None,
+        permission_names: Optional[Sequence[str]] = None,
         parent_role_name: Optional[str] = None,
         is_system_role: bool = False,
     ) -> Role:
@@ -323,7 +564,7 @@ class RBACService:
             name: Unique role identifier (lowercase)
             display_name: Human-friendly display name
             description: Role description
-            permission_names: List of permission names to assign
+            permission_names: Permission names to assign
             parent_role_name: Name of parent role for inheritance
             is_system_role: If True, role cannot be deleted
 
@@ -357,16 +598,13 @@ class RBACService:
             parent_role_id=parent_role.id if parent_role else None,
         )
 
-        # Assign permissions
+        # Assign permissions - one IN query, then a single collection assignment
         if permission_names:
-            for perm_name in permission_names:
-                perm = Permission.query.filter_by(name=perm_name, is_deleted=False).first()
-                if perm is None:
-                    raise PermissionNotFoundError(permission_name=perm_name)
-                role.permissions.append(perm)
+            role.permissions = RBACService.get_permissions_or_404(permission_names)
 
         db.session.add(role)
         db.session.commit()
+        RBACService.invalidate_role_lists()
 
         logger.info(f"Created role '{name}' with {len(permission_names or [])} permissions")
 
@@ -400,6 +638,8 @@ class RBACService:
         # Soft delete
         role.soft_delete()
         db.session.commit()
+        RBACService.invalidate_role_lists()
+        RBACService.invalidate_user_permissions()
 
         logger.info(
             f"Role '{role_name}' deleted by user_id={deleted_by.id if deleted_by else 'system'}"
@@ -422,7 +662,9 @@ class RBACService:
         Returns:
             Permission object or None if not found
         """
-        return Permission.query.filter_by(name=permission_name, is_deleted=False).first()
+        return db.session.execute(
+            _PERMISSION_BY_NAME_STMT, {"name": permission_name}
+        ).scalar_one_or_none()
 
     @staticmethod
     def get_permission_or_404(permission_name: str) -> Permission:
@@ -445,6 +687,35 @@ class RBACService:
 
         return perm
 
+    @staticmethod
+    def get_permissions_or_404(permission_names: Sequence[str]) -> List[Permission]:
+        """
+        Get several permissions with a single IN query.
+
+        Validates that every name exists before returning, so callers can
+        assign the result in one go without risking a partial update.
+
+        Args:
+            permission_names: Permission names to load
+
+        Returns:
+            List[Permission]: The matching Permission objects (duplicates removed)
+
+        Raises:
+            PermissionNotFoundError: For the first name that doesn't exist
+        """
+        by_name = {
+            perm.name: perm
+            for perm in Permission.query.filter(
+                Permission.name.in_(permission_names), Permission.is_deleted.is_(False)
+            )
+        }
+        for perm_name in permission_names:
+            if perm_name not in by_name:
+                raise PermissionNotFoundError(permission_name=perm_name)
+
+        return list(by_name.values())
+
     @staticmethod
     def grant_direct_permission(
         user: User,
@@ -484,6 +755,7 @@ class RBACService:
         # Grant the permission
         user.direct_permissions.append(perm)
         db.session.commit()
+        RBACService.invalidate_user_permissions(user.id)
 
         logger.info(
             f"Direct permission '{permission_name}' granted to user_id={user.id} "
@@ -492,6 +764,66 @@ class RBACService:
 
         return perm
 
+    @staticmethod
+    def grant_direct_permissions(
+        user: User,
+        permission_names: List[str],
+        granted_by: Optional[User] = None,
+        reason: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Grant several direct permissions to a user in one statement.
+
+        Unlike grant_direct_permission(), this is idempotent: permissions the
+        user already has are skipped instead of raising. All rows go to the
+        database in a single INSERT ... ON CONFLICT DO NOTHING, committed once.
+
+        Args:
+            user: The User to grant the permissions to
+            permission_names: The permissions to grant
+            granted_by: The admin user who is granting (for audit)
+            reason: Reason for granting (for audit trail)
+
+        Returns:
+            List[str]: Names of the permissions that were newly granted
+
+        Raises:
+            PermissionNotFoundError: If any permission doesn't exist
+                (nothing is granted in that case)
+        """
+        perms = RBACService.get_permissions_or_404(permission_names)
+
+        stmt = (
+            pg_insert(user_permissions)
+            .values(
+                [
+                    {
+                        "user_id": user.id,
+                        "permission_id": perm.id,
+                        "granted_by": granted_by.id if granted_by else None,
+                        "reason": reason,
+                    }
+                    for perm in perms
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(user_permissions.c.permission_id)
+        )
+        granted_ids = set(db.session.execute(stmt).scalars())
+        db.session.commit()
+
+        # The rows were written with Core, so reload the relationship on next access
+        db.session.expire(user, ["direct_permissions"])
+        RBACService.invalidate_user_permissions(user.id)
+
+        granted = [perm.name for perm in perms if perm.id in granted_ids]
+        logger.info(
+            f"Direct permissions {granted} granted to user_id={user.id} "
+            f"by user_id={granted_by.id if granted_by else 'system'}, reason={reason}"
+        )
+
+        return granted
+
     @staticmethod
     def revoke_direct_permission(
         user: User,
@@ -526,6 +858,7 @@ class RBACService:
         # Revoke the permission
         user.direct_permissions.remove(perm)
         db.session.commit()
+        RBACService.invalidate_user_permissions(user.id)
 
         logger.info(
             f"Direct permission '{permission_name}' revoked from user_id={user.id} "
@@ -614,6 +947,44 @@ class RBACService:
                 required_permissions=permissions,
             )
 
+    # =========================================================================
+    # CACHE INVALIDATION
+    # =========================================================================
+
+    @staticmethod
+    def invalidate_role_lists() -> None:
+        """
+        Drop cached role list pages.
+
+        Call after any change that affects what list_roles returns
+        (creating, updating or deleting a role).
+        """
+        rbac_cache.invalidate_prefix(ROLE_LIST_CACHE_PREFIX)
+
+    @staticmethod
+    def invalidate_user_permissions(user_id: Optional[int] = None) -> None:
+        """
+        Drop cached effective permissions.
+
+        Args:
+            user_id: Only drop this user's entry. If None, drop every user's
+                entry (needed when a role definition changes, since that can
+                affect any user holding the role or a child role).
+        """
+        if user_id is None:
+            rbac_cache.invalidate_prefix(USER_PERMISSIONS_CACHE_PREFIX)
+        else:
+            rbac_cache.invalidate(f"{USER_PERMISSIONS_CACHE_PREFIX}{user_id}")
+
+    @staticmethod
+    def invalidate_permission_lists() -> None:
+        """
+        Drop cached permission list pages.
+
+        Call after permissions are added or removed (e.g., seeding).
+        """
+        rbac_cache.invalidate_prefix(PERMISSION_LIST_CACHE_PREFIX)
+
     # =========================================================================
     # SEEDING
     # =========================================================================
@@ -628,34 +999,26 @@ class RBACService:
         Returns:
             Tuple of (created_count, skipped_count)
         """
-        created = 0
-        skipped = 0
+        rows = PermissionRegistry.parsed_permissions()
 
-        for perm_name, description in PermissionRegistry.PERMISSIONS.items():
-            # Check if permission exists
-            existing = Permission.query.filter_by(name=perm_name).first()
-            if existing:
-                skipped += 1
-                continue
-
-            # Parse resource:action
-            if ":" in perm_name:
-                resource, action = perm_name.split(":", 1)
-            else:
-                resource = perm_name
-                action = "*"
-
-            # Create permission
-            perm = Permission(
-                name=perm_name,
-                resource=resource,
-                action=action,
-                description=description,
+        # One query for every permission that already exists
+        existing = {
+            name
+            for (name,) in db.session.query(Permission.name).filter(
+                Permission.name.in_([row["name"] for row in rows])
             )
-            db.session.add(perm)
-            created += 1
+        }
+
+        # Bulk insert the missing ones in a single executemany
+        new_rows = [row for row in rows if row["name"] not in existing]
+        if new_rows:
+            db.session.execute(insert(Permission), new_rows)
+
+        created = len(new_rows)
+        skipped = len(rows) - created
 
         db.session.commit()
+        RBACService.invalidate_permission_lists()
         logger.info(f"Seeded permissions: {created} created, {skipped} skipped")
 
         return created, skipped
@@ -673,37 +1036,42 @@ class RBACService:
         """
         created = 0
         skipped = 0
+        default_roles = PermissionRegistry.DEFAULT_ROLES
+
+        # Look up existing roles and all referenced permissions up front
+        # (two queries in total, instead of one or more per role)
+        existing = {
+            name for (name,) in db.session.query(Role.name).filter(Role.name.in_(default_roles))
+        }
+        needed = {perm for (_, _, perm_names, _) in default_roles.values() for perm in perm_names}
+        by_name = {perm.name: perm for perm in Permission.query.filter(Permission.name.in_(needed))}
 
         for role_name, (
             display_name,
             description,
             permission_names,
             is_system,
-        ) in PermissionRegistry.DEFAULT_ROLES.items():
+        ) in default_roles.items():
             # Check if role exists
-            existing = Role.query.filter_by(name=role_name).first()
-            if existing:
+            if role_name in existing:
                 skipped += 1
                 continue
 
-            # Create role
+            # Create role with all of its permissions assigned at once
             role = Role(
                 name=role_name,
                 display_name=display_name,
                 description=description,
                 is_system_role=is_system,
             )
-
-            # Assign permissions
-            for perm_name in permission_names:
-                perm = Permission.query.filter_by(name=perm_name).first()
-                if perm:
-                    role.permissions.append(perm)
+            role.permissions = [by_name[name] for name in permission_names if name in by_name]
 
             db.session.add(role)
             created += 1
 
         db.session.commit()
+        RBACService.invalidate_role_lists()
+        RBACService.invalidate_user_permissions()
         logger.info(f"Seeded roles: {created} created, {skipped} skipped")
 
         return created, skipped
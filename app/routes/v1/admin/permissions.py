@@ -14,23 +14,33 @@ Endpoints:
     DELETE /admin/users/<id>/permissions/<perm>   - Revoke direct permission
 """
 
+import heapq
 import logging
-from typing import Any, Dict, List, Optional
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Tuple
 
+from flask import current_app
 from flask_openapi3 import APIBlueprint, Tag
 from pydantic import BaseModel, Field
+from sqlalchemy import select
 
 from app.auth import get_current_user
-from app.models import Permission, User
+from app.models import Permission
 from app.rbac import RBACService, permission_required
 from app.rbac.exceptions import DirectPermissionError, PermissionNotFoundError
+from app.rbac.services import PERMISSION_LIST_CACHE_PREFIX, rbac_cache
 from app.schemas.rbac import DirectPermissionGrantSchema, PermissionListQuery
+from app.services import UserService
+from app.utils.pagination import paginate
 from app.utils.responses import (
     ErrorCode,
     StandardErrorResponse,
     StandardSuccessResponse,
     error_response,
+    not_found_response,
+    pagination_meta,
     success_response,
+    validation_error_response,
 )
 
 logger = logging.getLogger(__name__)
@@ -92,34 +102,40 @@ class MessageResponse(StandardSuccessResponse):
 )
 @permission_required("permissions:list", "permissions:read")
 def list_permissions(query: PermissionListQuery):
-    """List all permissions."""
+    """
+    List all permissions.
+
+    Pages are cached for RBAC_CACHE_TTL seconds; seeding invalidates them.
+    """
+    cache_key = f"{PERMISSION_LIST_CACHE_PREFIX}{query.resource}:{query.page}:{query.per_page}"
+    permissions_data, meta = rbac_cache.get_or_set(
+        cache_key,
+        lambda: _load_permissions_page(query),
+        ttl=current_app.config.get("RBAC_CACHE_TTL", 0),
+    )
+
+    return success_response(data=permissions_data, meta=meta)
+
+
+def _load_permissions_page(
+    query: PermissionListQuery,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Query one page of permissions and return (serialized permissions, pagination meta)."""
     # Build query
-    perm_query = Permission.query.filter_by(is_deleted=False)
+    stmt = select(Permission).where(Permission.is_deleted.is_(False))
 
     if query.resource:
-        perm_query = perm_query.filter_by(resource=query.resource)
-
-    # Pagination
-    total = perm_query.count()
-    permissions = (
-        perm_query.order_by(Permission.resource, Permission.action)
-        .offset((query.page - 1) * query.per_page)
-        .limit(query.per_page)
-        .all()
+        stmt = stmt.where(Permission.resource == query.resource)
+
+    # Pagination (page rows + total count in a single query)
+    permissions, total = paginate(
+        stmt.order_by(Permission.resource, Permission.action), query.page, query.per_page
     )
 
     # Format response
     permissions_data = [perm.to_dict() for perm in permissions]
 
-    return success_response(
-        data=permissions_data,
-        meta={
-            "total": total,
-            "page": query.page,
-            "per_page": query.per_page,
-            "total_pages": (total + query.per_page - 1) // query.per_page,
-        },
-    )
+    return permissions_data, pagination_meta(total, query.page, query.per_page)
 
 
 class PermissionPathParam(BaseModel):
@@ -141,11 +157,7 @@ def get_permission(path: PermissionPathParam):
     perm = Permission.query.filter_by(name=path.permission_name, is_deleted=False).first()
 
     if not perm:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"Permission '{path.permission_name}' not found",
-            status_code=404,
-        )
+        return not_found_response(f"Permission '{path.permission_name}' not found")
 
     return success_response(data=perm.to_dict())
 
@@ -178,14 +190,12 @@ class UserPermissionRevokePathParam(BaseModel):
 @permission_required("permissions:read", "users:read")
 def get_user_permissions(path: UserPermissionPathParam):
     """Get all permissions for a user."""
-    user = User.query.filter_by(id=path.user_id, is_deleted=False).first()
+    # Eager-load the whole permission graph (roles, their parent chain and
+    # direct permissions) up front so the loops below never hit the database
+    user = RBACService.get_user_with_permission_graph(path.user_id)
 
     if not user:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"User with id={path.user_id} not found",
-            status_code=404,
-        )
+        return not_found_response(f"User with id={path.user_id} not found")
 
     # Get permissions breakdown
     role_permissions = set()
@@ -193,16 +203,21 @@ def get_user_permissions(path: UserPermissionPathParam):
         role_permissions.update(role.get_all_permissions())
 
     direct_permissions = {perm.name for perm in user.direct_permissions}
-    all_permissions = role_permissions.union(direct_permissions)
+
+    # Sort each source once; the effective list is a linear merge of the two
+    # sorted lists (groupby drops names granted both ways) - no third sort
+    role_sorted = sorted(role_permissions)
+    direct_sorted = sorted(direct_permissions)
+    effective_sorted = [name for name, _ in groupby(heapq.merge(role_sorted, direct_sorted))]
 
     return success_response(
         data={
             "user_id": user.id,
             "username": user.username,
             "roles": [role.name for role in user.roles],
-            "role_permissions": sorted(role_permissions),
-            "direct_permissions": sorted(direct_permissions),
-            "effective_permissions": sorted(all_permissions),
+            "role_permissions": role_sorted,
+            "direct_permissions": direct_sorted,
+            "effective_permissions": effective_sorted,
         }
     )
 
@@ -226,17 +241,34 @@ Use sparingly - most permissions should come from roles.
 @permission_required("permissions:assign")
 def grant_direct_permission(path: UserPermissionPathParam, body: DirectPermissionGrantSchema):
     """Grant a direct permission to a user."""
-    user = User.query.filter_by(id=path.user_id, is_deleted=False).first()
+    user = UserService.get_by_id(path.user_id)
 
     if not user:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"User with id={path.user_id} not found",
-            status_code=404,
-        )
+        return not_found_response(f"User with id={path.user_id} not found")
 
     try:
         current_user = get_current_user()
+
+        # Bulk grant: one INSERT for the whole list, already-held ones skipped
+        if body.permissions is not None:
+            granted = RBACService.grant_direct_permissions(
+                user=user,
+                permission_names=body.permissions,
+                granted_by=current_user,
+                reason=body.reason,
+            )
+            return success_response(
+                data={"granted": granted},
+                message=f"{len(granted)} permission(s) granted to user '{user.username}'",
+            )
+
+        # The schema already rejects a body with neither field; kept explicit
+        # so the check survives `python -O` and schema changes
+        if body.permission is None:
+            return validation_error_response(
+                [{"field": "permission", "message": "Provide 'permission' or 'permissions'"}]
+            )
+
         RBACService.grant_direct_permission(
             user=user,
             permission_name=body.permission,
@@ -248,12 +280,8 @@ def grant_direct_permission(path: UserPermissionPathParam, body: DirectPermissio
             message=f"Permission '{body.permission}' granted to user '{user.username}'"
         )
 
-    except PermissionNotFoundError:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"Permission '{body.permission}' not found",
-            status_code=404,
-        )
+    except PermissionNotFoundError as e:
+        return not_found_response(f"Permission '{e.permission_name}' not found")
     except DirectPermissionError as e:
         return error_response(
             code=ErrorCode.BAD_REQUEST,
@@ -276,14 +304,10 @@ def grant_direct_permission(path: UserPermissionPathParam, body: DirectPermissio
 @permission_required("permissions:revoke")
 def revoke_direct_permission(path: UserPermissionRevokePathParam):
     """Revoke a direct permission from a user."""
-    user = User.query.filter_by(id=path.user_id, is_deleted=False).first()
+    user = UserService.get_by_id(path.user_id)
 
     if not user:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"User with id={path.user_id} not found",
-            status_code=404,
-        )
+        return not_found_response(f"User with id={path.user_id} not found")
 
     try:
         current_user = get_current_user()
@@ -298,11 +322,7 @@ def revoke_direct_permission(path: UserPermissionRevokePathParam):
         )
 
     except PermissionNotFoundError:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"Permission '{path.permission_name}' not found",
-            status_code=404,
-        )
+        return not_found_response(f"Permission '{path.permission_name}' not found")
     except DirectPermissionError as e:
         return error_response(
             code=ErrorCode.BAD_REQUEST,
@@ -18,22 +18,36 @@ Endpoints:
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from flask import current_app
 from flask_openapi3 import APIBlueprint, Tag
 from pydantic import BaseModel, Field
+from sqlalchemy import func, select
+from sqlalchemy.orm import lazyload, selectinload
 
 from app import db
 from app.auth import get_current_user
-from app.models import Role, User
+from app.models import Permission, Role, User, role_permissions
 from app.rbac import RBACService, permission_required
-from app.rbac.exceptions import RoleAssignmentError, RoleNotFoundError, SystemRoleError
+from app.rbac.exceptions import (
+    PermissionNotFoundError,
+    RoleAssignmentError,
+    RoleNotFoundError,
+    SystemRoleError,
+)
+from app.rbac.services import ROLE_LIST_CACHE_PREFIX, rbac_cache
 from app.schemas.rbac import RoleAssignSchema, RoleCreateSchema, RoleListQuery, RoleUpdateSchema
+from app.services import UserService
+from app.utils.pagination import paginate
 from app.utils.responses import (
     ErrorCode,
     StandardErrorResponse,
     StandardSuccessResponse,
+    conditional_response,
     error_response,
+    not_found_response,
+    pagination_meta,
     success_response,
 )
 
@@ -90,34 +104,62 @@ class MessageResponse(StandardSuccessResponse):
 )
 @permission_required("roles:list", "roles:read")
 def list_roles(query: RoleListQuery):
-    """List all roles with optional permission details."""
+    """
+    List all roles with optional permission details.
+
+    Pages are cached for RBAC_CACHE_TTL seconds; role changes invalidate them.
+    """
+    cache_key = (
+        f"{ROLE_LIST_CACHE_PREFIX}{query.include_system}:{query.include_permissions}"
+        f":{query.page}:{query.per_page}"
+    )
+    roles_data, meta = rbac_cache.get_or_set(
+        cache_key,
+        lambda: _load_roles_page(query),
+        ttl=current_app.config.get("RBAC_CACHE_TTL", 0),
+    )
+
+    return success_response(data=roles_data, meta=meta)
+
+
+def _load_roles_page(query: RoleListQuery) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Query one page of roles and return (serialized roles, pagination meta)."""
     # Build query
-    role_query = Role.query.filter_by(is_deleted=False)
+    # Role.permissions is never loaded here (it's selectin by default).
+    # When permissions are requested, PostgreSQL aggregates the names per
+    # role in the same query as the page rows, so there is no second
+    # round-trip and no per-role collection to build in Python.
+    # parent_role stays lazy: parents are usually on the same page and are
+    # then resolved from the identity map without a query.
+    stmt = select(Role).options(lazyload(Role.permissions)).where(Role.is_deleted.is_(False))
+    if query.include_permissions:
+        stmt = stmt.add_columns(_permission_names_of(Role.id))
 
     if not query.include_system:
-        role_query = role_query.filter_by(is_system_role=False)
-
-    # Pagination
-    total = role_query.count()
-    roles = (
-        role_query.order_by(Role.name)
-        .offset((query.page - 1) * query.per_page)
-        .limit(query.per_page)
-        .all()
-    )
+        stmt = stmt.where(Role.is_system_role.is_(False))
+
+    # Pagination (page rows + total count in a single query)
+    rows, total = paginate(stmt.order_by(Role.name), query.page, query.per_page)
 
     # Format response
-    roles_data = [role.to_dict(include_permissions=query.include_permissions) for role in roles]
-
-    return success_response(
-        data=roles_data,
-        meta={
-            "total": total,
-            "page": query.page,
-            "per_page": query.per_page,
-            "total_pages": (total + query.per_page - 1) // query.per_page,
-        },
+    if query.include_permissions:
+        roles_data = [{**role.to_dict(), "permissions": names} for role, names in rows]
+    else:
+        roles_data = [role.to_dict() for role in rows]
+
+    return roles_data, pagination_meta(total, query.page, query.per_page)
+
+
+def _permission_names_of(role_id: Any) -> Any:
+    """Correlated ARRAY(SELECT ...) of a role's permission names, sorted by name."""
+    names = (
+        select(Permission.name)
+        .join(role_permissions, role_permissions.c.permission_id == Permission.id)
+        .where(role_permissions.c.role_id == role_id)
+        .order_by(Permission.name)
+        .scalar_subquery()
     )
+    return func.array(names).label("permission_names")
 
 
 @roles_bp.post(
@@ -144,7 +186,9 @@ def create_role(body: RoleCreateSchema):
             is_system_role=False,  # User-created roles are not system roles
         )
 
-        logger.info(f"Role '{body.name}' created by user_id={get_current_user().id}")
+        # Guarded: the user lookup for the log line is skipped unless INFO is on
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Role '%s' created by user_id=%s", body.name, get_current_user().id)
 
         return success_response(
             data=role.to_dict(include_permissions=True),
@@ -159,11 +203,7 @@ def create_role(body: RoleCreateSchema):
             status_code=409,
         )
     except RoleNotFoundError as e:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=str(e),
-            status_code=404,
-        )
+        return not_found_response(str(e))
 
 
 class RolePathParam(BaseModel):
@@ -198,11 +238,7 @@ def get_role(path: RolePathParam):
         return success_response(data=role_data)
 
     except RoleNotFoundError:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"Role '{path.role_name}' not found",
-            status_code=404,
-        )
+        return not_found_response(f"Role '{path.role_name}' not found")
 
 
 @roles_bp.put(
@@ -222,6 +258,12 @@ def update_role(path: RolePathParam, body: RoleUpdateSchema):
     try:
         role = RBACService.get_role_or_404(role_name=path.role_name)
 
+        # Resolve permissions first (single IN query) so an unknown name
+        # aborts the request before anything on the role is changed
+        permissions = None
+        if body.permissions is not None:
+            permissions = RBACService.get_permissions_or_404(body.permissions)
+
         # Update fields
         if body.display_name is not None:
             role.display_name = body.display_name
@@ -229,15 +271,9 @@ def update_role(path: RolePathParam, body: RoleUpdateSchema):
         if body.description is not None:
             role.description = body.description
 
-        # Update permissions if provided
-        if body.permissions is not None:
-            from app.models import Permission
-
-            role.permissions.clear()
-            for perm_name in body.permissions:
-                perm = Permission.query.filter_by(name=perm_name, is_deleted=False).first()
-                if perm:
-                    role.permissions.append(perm)
+        # Update permissions if provided (replaces the whole collection)
+        if permissions is not None:
+            role.permissions = permissions
 
         # Update parent role if provided
         if body.parent_role is not None:
@@ -248,20 +284,19 @@ def update_role(path: RolePathParam, body: RoleUpdateSchema):
                 role.parent_role_id = parent.id
 
         db.session.commit()
+        RBACService.invalidate_role_lists()
+        RBACService.invalidate_user_permissions()
 
-        logger.info(f"Role '{path.role_name}' updated by user_id={get_current_user().id}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Role '%s' updated by user_id=%s", path.role_name, get_current_user().id)
 
         return success_response(
             data=role.to_dict(include_permissions=True),
             message=f"Role '{path.role_name}' updated successfully",
         )
 
-    except RoleNotFoundError as e:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=str(e),
-            status_code=404,
-        )
+    except (RoleNotFoundError, PermissionNotFoundError) as e:
+        return not_found_response(str(e))
 
 
 @roles_bp.delete(
@@ -285,11 +320,7 @@ def delete_role(path: RolePathParam):
         return success_response(message=f"Role '{path.role_name}' deleted successfully")
 
     except RoleNotFoundError:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"Role '{path.role_name}' not found",
-            status_code=404,
-        )
+        return not_found_response(f"Role '{path.role_name}' not found")
     except SystemRoleError as e:
         return error_response(
             code=ErrorCode.FORBIDDEN,
@@ -326,24 +357,35 @@ class UserRoleRevokePathParam(BaseModel):
 @permission_required("roles:read", "users:read")
 def get_user_roles(path: UserRolePathParam):
     """Get roles for a specific user."""
-    user = User.query.filter_by(id=path.user_id, is_deleted=False).first()
+    # Roles, their permissions and direct parents come back in a fixed number
+    # of queries so to_dict() below never lazy-loads. The inherited chain
+    # isn't needed here: the effective set is resolved in SQL.
+    user = (
+        User.query.options(
+            selectinload(User.roles).selectinload(Role.permissions),
+            selectinload(User.roles).selectinload(Role.parent_role),
+        )
+        .filter_by(id=path.user_id, is_deleted=False)
+        .first()
+    )
 
     if not user:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"User with id={path.user_id} not found",
-            status_code=404,
-        )
+        return not_found_response(f"User with id={path.user_id} not found")
 
     roles_data = [role.to_dict(include_permissions=True) for role in user.roles]
 
-    return success_response(
-        data={
-            "user_id": user.id,
-            "username": user.username,
-            "roles": roles_data,
-            "all_permissions": list(user.get_all_permissions()),
-        }
+    # Role changes don't touch users.updated_at, so the ETag is a hash of the
+    # body: it saves the transfer, not the queries
+    return conditional_response(
+        success_response(
+            data={
+                "user_id": user.id,
+                "username": user.username,
+                "roles": roles_data,
+                "all_permissions": RBACService.get_user_permission_names(user.id),
+            }
+        ),
+        private=True,
     )
 
 
@@ -361,14 +403,10 @@ def get_user_roles(path: UserRolePathParam):
 @permission_required("roles:assign")
 def assign_role_to_user(path: UserRolePathParam, body: RoleAssignSchema):
     """Assign a role to a user."""
-    user = User.query.filter_by(id=path.user_id, is_deleted=False).first()
+    user = UserService.get_by_id(path.user_id)
 
     if not user:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"User with id={path.user_id} not found",
-            status_code=404,
-        )
+        return not_found_response(f"User with id={path.user_id} not found")
 
     try:
         current_user = get_current_user()
@@ -383,11 +421,7 @@ def assign_role_to_user(path: UserRolePathParam, body: RoleAssignSchema):
         )
 
     except RoleNotFoundError:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"Role '{body.role_name}' not found",
-            status_code=404,
-        )
+        return not_found_response(f"Role '{body.role_name}' not found")
     except RoleAssignmentError as e:
         return error_response(
             code=ErrorCode.BAD_REQUEST,
@@ -410,14 +444,10 @@ def assign_role_to_user(path: UserRolePathParam, body: RoleAssignSchema):
 @permission_required("roles:revoke")
 def revoke_role_from_user(path: UserRoleRevokePathParam):
     """Revoke a role from a user."""
-    user = User.query.filter_by(id=path.user_id, is_deleted=False).first()
+    user = UserService.get_by_id(path.user_id)
 
     if not user:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"User with id={path.user_id} not found",
-            status_code=404,
-        )
+        return not_found_response(f"User with id={path.user_id} not found")
 
     try:
         current_user = get_current_user()
@@ -432,11 +462,7 @@ def revoke_role_from_user(path: UserRoleRevokePathParam):
         )
 
     except RoleNotFoundError:
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message=f"Role '{path.role_name}' not found",
-            status_code=404,
-        )
+        return not_found_response(f"Role '{path.role_name}' not found")
     except RoleAssignmentError as e:
         return error_response(
             code=ErrorCode.BAD_REQUEST,
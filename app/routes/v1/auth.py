@@ -5,6 +5,7 @@ These routes handle JWT-based authentication:
 - POST /api/v1/auth/register  - Create new user account
 - POST /api/v1/auth/login     - Get tokens with email/password
 - POST /api/v1/auth/logout    - Revoke current token
+- POST /api/v1/auth/logout-all - Revoke every token of the current user
 - POST /api/v1/auth/refresh   - Get new access token using refresh token
 - GET  /api/v1/auth/me        - Get current user info
 
@@ -38,6 +39,7 @@ from app.utils.responses import (
     ErrorCode,
     StandardErrorResponse,
     StandardSuccessResponse,
+    conditional_response,
     error_response,
     success_response,
 )
@@ -136,15 +138,7 @@ def register_user(body: UserCreateSchema):
     Delegates to AuthService.register for business logic.
     """
     try:
-        user_data = AuthService.register(
-            username=body.username,
-            email=body.email,
-            password=body.password,
-            first_name=body.first_name,
-            middle_name=body.middle_name,
-            last_name=body.last_name,
-            bio=body.bio,
-        )
+        user_data = AuthService.register(body)
         return success_response(
             data=user_data,
             message="User created successfully",
@@ -228,12 +222,44 @@ def logout():
 
     Delegates to AuthService.logout for business logic.
     """
-    jti = get_jwt()["jti"]
-    AuthService.logout(jti)
+    AuthService.logout(get_jwt())
 
     return success_response(message="Logout successful")
 
 
+@auth_bp_v1.post(
+    "/logout-all",
+    summary="Logout From All Devices",
+    description="""
+Revoke every access and refresh token issued to the current user.
+
+Use this after a password change or when a device is lost.
+All sessions, including the current one, must log in again.
+    """,
+    responses={
+        200: StandardSuccessResponse,
+        401: StandardErrorResponse,
+    },
+    security=[{"jwt": []}],  # Requires JWT authentication
+)
+@jwt_required()
+def logout_all():
+    """
+    Logout from all devices.
+
+    Delegates to AuthService.logout_all for business logic.
+    """
+    try:
+        AuthService.logout_all(get_current_user())
+        return success_response(message="Logged out from all devices")
+    except UserNotAuthenticatedError:
+        return error_response(
+            code=ErrorCode.UNAUTHORIZED,
+            message="User not found",
+            status_code=401,
+        )
+
+
 @auth_bp_v1.post(
     "/refresh",
     summary="Refresh Token",
@@ -293,7 +319,11 @@ def get_me():
     try:
         user = get_current_user()
         user_data = AuthService.get_current_user_info(user)
-        return success_response(data=user_data)
+        return conditional_response(
+            success_response(data=user_data),
+            etag=f"user-{user.id}-{user.updated_at.isoformat()}",
+            private=True,
+        )
     except UserNotAuthenticatedError:
         return error_response(
             code=ErrorCode.UNAUTHORIZED,
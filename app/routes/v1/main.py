@@ -13,6 +13,7 @@ from typing import Optional
 from flask_openapi3 import APIBlueprint, Tag
 from pydantic import BaseModel, Field
 
+from app.utils.health import check_database
 from app.utils.responses import StandardSuccessResponse, success_response
 from app.version import __version__
 
@@ -112,19 +113,13 @@ def health():
     Health check endpoint for API v1.
 
     Actually verifies database connectivity by executing a simple query.
+    The result is cached briefly to absorb frequent probes
+    (see app/utils/health.py).
 
     Returns:
         JSON response indicating service health
     """
-    from app import db
-
-    # Actually check database connection
-    try:
-        db.session.execute(db.text("SELECT 1"))
-        db_status = "connected"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_status = "disconnected"
+    db_status = check_database()
 
     return success_response(
         data={
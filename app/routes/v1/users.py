@@ -23,13 +23,15 @@ from flask_jwt_extended import jwt_required
 from flask_openapi3 import APIBlueprint, Tag
 from pydantic import BaseModel, Field
 
-from app.schemas import UserResponseSchema, UserUpdateSchema
+from app.schemas import QuerySchema, UserResponseSchema, UserUpdateSchema
 from app.services import UserNotFoundError, UserService
 from app.utils.responses import (
     ErrorCode,
     StandardErrorResponse,
     StandardSuccessResponse,
+    conditional_response,
     error_response,
+    pagination_meta,
     success_response,
 )
 
@@ -98,12 +100,21 @@ class UserPath(BaseModel):
 # =============================================================================
 
 
-class UserListQuery(BaseModel):
+class UserListQuery(QuerySchema):
     """Query parameters for listing users with pagination."""
 
     page: int = Field(default=1, ge=1, description="Page number (1-indexed)")
     per_page: int = Field(default=20, ge=1, le=100, description="Items per page (max 100)")
     include_deleted: bool = Field(default=False, description="Include soft-deleted users")
+    cursor: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Keyset pagination: return users after this ID (0 for the first page, then "
+            "meta.next_cursor). Ignores 'page'; faster for deep pages but reports only an "
+            "estimated total."
+        ),
+    )
 
 
 # =============================================================================
@@ -124,29 +135,39 @@ def get_users(query: UserListQuery):
     Get all users with pagination.
 
     Supports filtering soft-deleted users and pagination.
+    With `cursor`, pages by ID instead of OFFSET (keyset pagination).
     """
+    if query.cursor is not None:
+        users, next_cursor = UserService.get_after(
+            after_id=query.cursor,
+            limit=query.per_page,
+            include_deleted=query.include_deleted,
+        )
+        return success_response(
+            data=[UserResponseSchema.serialize_orm(user) for user in users],
+            meta={
+                "per_page": query.per_page,
+                "count": len(users),
+                "next_cursor": next_cursor,
+                "estimated_total": UserService.get_estimated_total(),
+                "api_version": "v1",
+            },
+        )
+
     users, total = UserService.get_all(
         include_deleted=query.include_deleted,
         page=query.page,
         per_page=query.per_page,
     )
 
-    # Convert each user to response schema
-    users_data = [UserResponseSchema.model_validate(user).to_dict() for user in users]
-
-    # Calculate pagination metadata
-    total_pages = (total + query.per_page - 1) // query.per_page  # Ceiling division
+    # Serialize each user (rows come from our DB, so no re-validation needed)
+    users_data = [UserResponseSchema.serialize_orm(user) for user in users]
 
     return success_response(
         data=users_data,
-        meta={
-            "count": len(users_data),
-            "total": total,
-            "page": query.page,
-            "per_page": query.per_page,
-            "total_pages": total_pages,
-            "api_version": "v1",
-        },
+        meta=pagination_meta(
+            total, query.page, query.per_page, count=len(users_data), api_version="v1"
+        ),
     )
 
 
@@ -171,9 +192,11 @@ def get_user(path: UserPath):
     Uses service layer which excludes soft-deleted users by default.
     """
     try:
-        user = UserService.get_by_id_or_404(path.user_id)
-        response_data = UserResponseSchema.model_validate(user)
-        return success_response(data=response_data.to_dict())
+        user_data = UserService.get_public_data(path.user_id)
+        return conditional_response(
+            success_response(data=user_data),
+            etag=f"user-{user_data['id']}-{user_data['updated_at'].isoformat()}",
+        )
     except UserNotFoundError:
         return error_response(
             code=ErrorCode.RESOURCE_NOT_FOUND,
@@ -212,9 +235,8 @@ def update_user(path: UserPath, body: UserUpdateSchema):
     """
     try:
         user = UserService.update_user(path.user_id, body)
-        response_data = UserResponseSchema.model_validate(user)
         return success_response(
-            data=response_data.to_dict(),
+            data=UserResponseSchema.serialize_orm(user),
             message="User updated successfully",
         )
     except UserNotFoundError:
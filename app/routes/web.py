@@ -9,16 +9,20 @@ Prefix: / (Root)
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 
 import flask
-from flask import current_app, render_template
+from flask import current_app, make_response, render_template
 from flask_openapi3 import APIBlueprint, Tag
 
-from app import db
+from app.utils.health import check_database
 
 # Module-level logger
 logger = logging.getLogger(__name__)
 
+# Browsers/proxies may reuse the landing page for this many seconds
+INDEX_CACHE_MAX_AGE = 60
+
 # =============================================================================
 # Web Blueprint Setup
 # =============================================================================
@@ -33,48 +37,73 @@ web_bp = APIBlueprint(
 )
 
 
+@web_bp.record_once
+def _resolve_page_config(state) -> None:
+    """
+    Read the config values the pages display once, when the blueprint is registered.
+
+    APP_VERSION and ENV never change after create_app(), so the handlers read
+    them from one dict in app.extensions instead of calling
+    current_app.config.get() for each value on every request.
+    """
+    state.app.extensions["web"] = {
+        "app_name": "Flask API Starter",
+        "version": state.app.config.get("APP_VERSION", "1.0.0"),
+        "env": state.app.config.get("ENV", "production"),
+    }
+
+
 # =============================================================================
 # Routes
 # =============================================================================
 
 
+@lru_cache(maxsize=4)
+def _render_index(app_name: str, version: str, env: str) -> str:
+    """
+    Render the landing page once per (app_name, version, env).
+
+    The page only depends on these values, which are fixed for the lifetime
+    of the process, so the HTML is rendered on the first request and the
+    same string is returned afterwards.
+    """
+    return render_template("index.html", app_name=app_name, version=version, env=env)
+
+
 @web_bp.get("/", summary="Landing Page")
 def index():
     """Render the professional landing page."""
-    # access config from current_app
-    app_version = current_app.config.get("APP_VERSION", "1.0.0")
-    env = current_app.config.get("ENV", "production")
+    page = current_app.extensions["web"]
 
-    return render_template(
-        "index.html",
-        app_name="Flask API Starter",
-        version=app_version,
-        env=env,
-    )
+    # With template auto-reload (debug mode), render every time so edits to
+    # index.html show up without restarting the server
+    if current_app.jinja_env.auto_reload:
+        html = _render_index.__wrapped__(page["app_name"], page["version"], page["env"])
+    else:
+        html = _render_index(page["app_name"], page["version"], page["env"])
+
+    response = make_response(html)
+    response.cache_control.public = True
+    response.cache_control.max_age = INDEX_CACHE_MAX_AGE
+    return response
 
 
 @web_bp.get("/health", summary="Health Dashboard")
 def health_ui():
     """Render the visual health dashboard."""
-    # Check database connection
-    try:
-        db.session.execute(db.text("SELECT 1"))
-        db_status = "connected"
-        status = "healthy"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_status = "disconnected"
-        status = "degraded"
-
-    env = current_app.config.get("ENV", "production")
+    # Check database connection (cached briefly, shared with /api/v1/health)
+    db_status = check_database()
+    status = "healthy" if db_status == "connected" else "degraded"
+
+    page = current_app.extensions["web"]
 
     return render_template(
         "health.html",
-        app_name="Flask API Starter",
+        app_name=page["app_name"],
         status=status,
         database=db_status,
         api_version="v1",
-        env=env,
+        env=page["env"],
         timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         flask_version=flask.__version__,
     )
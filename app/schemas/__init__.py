@@ -30,7 +30,7 @@ Usage:
 """
 
 # Import all schemas for easy access
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, CachedSchemaModel, QuerySchema
 from app.schemas.rbac import (
     DirectPermissionGrantSchema,
     DirectPermissionRevokeSchema,
@@ -53,6 +53,8 @@ from app.schemas.validators import normalize_name, normalize_username, validate_
 __all__ = [
     # Base
     "BaseSchema",
+    "CachedSchemaModel",
+    "QuerySchema",
     # User schemas
     "UserCreateSchema",
     "UserLoginSchema",
@@ -3,8 +3,9 @@ Base Schema - Common Pydantic configuration and utilities.
 
 This module provides:
 1. BaseSchema - A base class with common configuration for all schemas
-2. Utility functions for validation
-3. Custom validators that can be reused across schemas
+2. QuerySchema - A base class for route query parameter models
+3. Utility functions for validation
+4. Custom validators that can be reused across schemas
 
 Why use a base schema?
     - Ensures consistent behavior across all schemas
@@ -13,9 +14,11 @@ Why use a base schema?
     - Makes it easy to add global features later (like logging, error formatting)
 """
 
-from typing import Any, Dict
+import copy
+from typing import Any, Dict, Tuple, Type
 
 from pydantic import BaseModel, ConfigDict
+from pydantic.json_schema import DEFAULT_REF_TEMPLATE, GenerateJsonSchema, JsonSchemaMode
 
 
 class BaseSchema(BaseModel):
@@ -77,8 +80,13 @@ class BaseSchema(BaseModel):
 
         Returns:
             dict: Dictionary representation of the schema
+
+        Note:
+            Calls the class's compiled pydantic-core serializer directly.
+            With no options to pass, model_dump() is just a Python wrapper
+            around the same call, so this returns an identical dict faster.
         """
-        return self.model_dump()
+        return self.__pydantic_serializer__.to_python(self)
 
     def to_json(self) -> str:
         """
@@ -89,4 +97,78 @@ class BaseSchema(BaseModel):
         Returns:
             str: JSON string representation of the schema
         """
-        return self.model_dump_json()
+        return self.__pydantic_serializer__.to_json(self).decode()
+
+
+# =============================================================================
+# OPENAPI MODEL SCHEMAS
+# =============================================================================
+
+# Cached JSON schemas, keyed by (model class, model_json_schema() arguments)
+_JSON_SCHEMA_CACHE: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+
+class CachedSchemaModel(BaseModel):
+    """
+    Base class for models whose JSON schema flask-openapi3 asks for repeatedly.
+
+    Generating a JSON schema is expensive - hundreds of microseconds per
+    model. A model's schema never changes after the class is defined, so this
+    base class generates it once per set of arguments and hands out copies
+    afterwards. Validation is unchanged: pydantic already compiles the
+    validator when the class is created.
+
+    Subclasses:
+        QuerySchema: query models (schema read on every request)
+        StandardSuccessResponse / StandardErrorResponse: response envelopes
+            (schema read once per route that documents them, at startup)
+    """
+
+    @classmethod
+    def model_json_schema(
+        cls,
+        by_alias: bool = True,
+        ref_template: str = DEFAULT_REF_TEMPLATE,
+        schema_generator: Type[GenerateJsonSchema] = GenerateJsonSchema,
+        mode: JsonSchemaMode = "validation",
+    ) -> Dict[str, Any]:
+        """
+        Return the model's JSON schema, generating it only on first use.
+
+        Returns:
+            dict: A fresh copy of the cached schema (safe for callers to modify)
+        """
+        key = (cls, by_alias, ref_template, schema_generator, mode)
+        schema = _JSON_SCHEMA_CACHE.get(key)
+        if schema is None:
+            schema = super().model_json_schema(
+                by_alias=by_alias,
+                ref_template=ref_template,
+                schema_generator=schema_generator,
+                mode=mode,
+            )
+            _JSON_SCHEMA_CACHE[key] = schema
+        return copy.deepcopy(schema)
+
+
+# =============================================================================
+# REQUEST PARAMETER SCHEMAS
+# =============================================================================
+
+
+class QuerySchema(CachedSchemaModel):
+    """
+    Base class for query-string parameter models used by flask-openapi3 routes.
+
+    Why a separate base class?
+        To turn `?page=2&per_page=20` into keyword arguments, flask-openapi3
+        calls `model_json_schema()` on the query model for EVERY request (it
+        needs the field types to know which parameters are lists). Generating
+        a JSON schema is expensive compared to a couple of microseconds for
+        the validation itself, so the schema comes from CachedSchemaModel's
+        per-class cache instead of being rebuilt each time.
+
+    Example:
+        class UserListQuery(QuerySchema):
+            page: int = Field(default=1, ge=1)
+    """
@@ -16,9 +16,21 @@ Naming Convention:
 - *Query: For query parameters
 """
 
-from typing import List, Optional
+import re
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from app.schemas.base import QuerySchema
+
+# Role names: letters, digits and underscores, with at least one letter or
+# digit. \w and [^\W_] use the same Unicode classes as str.isalnum(), so this
+# accepts exactly what `v.replace("_", "").isalnum()` did. Compiled once;
+# matching is a single pass with no intermediate strings.
+_is_role_name = re.compile(r"\A_*[^\W_]\w*\Z").match
+
+# Shared by the response schemas that are built from SQLAlchemy objects
+_ORM_CONFIG = ConfigDict(from_attributes=True)
 
 # =============================================================================
 # PERMISSION SCHEMAS
@@ -34,10 +46,10 @@ class PermissionResponseSchema(BaseModel):
     action: str = Field(..., description="Action part (e.g., 'delete')")
     description: Optional[str] = Field(None, description="Permission description")
 
-    model_config = ConfigDict(from_attributes=True)  # Enable ORM mode for SQLAlchemy models
+    model_config = _ORM_CONFIG  # Enable ORM mode for SQLAlchemy models
 
 
-class PermissionListQuery(BaseModel):
+class PermissionListQuery(QuerySchema):
     """Query parameters for listing permissions."""
 
     resource: Optional[str] = Field(None, description="Filter by resource")
@@ -72,8 +84,10 @@ class RoleCreateSchema(BaseModel):
         max_length=500,
         description="Role description",
     )
-    permissions: List[str] = Field(
-        default=[],
+    # An empty tuple default is immutable, so pydantic doesn't have to copy it
+    # for every request that omits the field
+    permissions: Tuple[str, ...] = Field(
+        default=(),
         description="List of permission names to assign",
         examples=[["users:read", "users:update"]],
     )
@@ -87,8 +101,8 @@ class RoleCreateSchema(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Ensure role name is lowercase and valid format."""
-        v = v.lower().strip()
-        if not v.replace("_", "").isalnum():
+        v = v.strip().lower()
+        if not _is_role_name(v):
             raise ValueError("Role name must contain only letters, numbers, and underscores")
         return v
 
@@ -129,10 +143,10 @@ class RoleResponseSchema(BaseModel):
     parent_role_name: Optional[str] = Field(None, description="Parent role name")
     permissions: Optional[List[str]] = Field(None, description="List of permission names")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_CONFIG
 
 
-class RoleListQuery(BaseModel):
+class RoleListQuery(QuerySchema):
     """Query parameters for listing roles."""
 
     include_permissions: bool = Field(
@@ -181,13 +195,24 @@ class RoleRevokeSchema(BaseModel):
 
 
 class DirectPermissionGrantSchema(BaseModel):
-    """Schema for granting a direct permission to a user."""
+    """
+    Schema for granting direct permissions to a user.
 
-    permission: str = Field(
-        ...,
+    Send either a single `permission` or a `permissions` list (bulk grant).
+    """
+
+    permission: Optional[str] = Field(
+        None,
         description="Permission to grant (e.g., 'users:delete')",
         examples=["users:delete", "reports:export"],
     )
+    permissions: Optional[List[str]] = Field(
+        None,
+        min_length=1,
+        max_length=100,
+        description="Several permissions to grant at once",
+        examples=[["users:delete", "reports:export"]],
+    )
     reason: Optional[str] = Field(
         None,
         max_length=500,
@@ -197,12 +222,32 @@ class DirectPermissionGrantSchema(BaseModel):
 
     @field_validator("permission")
     @classmethod
-    def validate_permission(cls, v: str) -> str:
+    def validate_permission(cls, v: Optional[str]) -> Optional[str]:
         """Ensure permission follows resource:action format."""
+        if v is None:
+            return v
         if ":" not in v:
             raise ValueError("Permission must be in 'resource:action' format")
         return v.lower().strip()
 
+    @field_validator("permissions")
+    @classmethod
+    def validate_permissions(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Ensure every permission follows resource:action format (duplicates dropped)."""
+        if v is None:
+            return v
+        for perm in v:
+            if ":" not in perm:
+                raise ValueError(f"Permission '{perm}' must be in 'resource:action' format")
+        return list(dict.fromkeys(perm.lower().strip() for perm in v))
+
+    @model_validator(mode="after")
+    def exactly_one_target(self) -> "DirectPermissionGrantSchema":
+        """Require either `permission` or `permissions`, but not both."""
+        if (self.permission is None) == (self.permissions is None):
+            raise ValueError("Provide either 'permission' or 'permissions'")
+        return self
+
 
 class DirectPermissionRevokeSchema(BaseModel):
     """Schema for revoking a direct permission from a user."""
@@ -246,7 +291,8 @@ class UserPermissionsResponseSchema(BaseModel):
 class BulkRoleAssignSchema(BaseModel):
     """Schema for assigning roles to multiple users."""
 
-    user_ids: List[int] = Field(
+    # Tuples: read-only payloads, and pydantic-core validates them faster than lists
+    user_ids: Tuple[int, ...] = Field(
         ...,
         min_length=1,
         max_length=100,
@@ -261,7 +307,7 @@ class BulkRoleAssignSchema(BaseModel):
 class BulkPermissionAssignSchema(BaseModel):
     """Schema for assigning permissions to a role."""
 
-    permissions: List[str] = Field(
+    permissions: Tuple[str, ...] = Field(
         ...,
         min_length=1,
         description="List of permissions to assign",
@@ -23,13 +23,21 @@ Naming Convention:
 """
 
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Annotated, Any, Callable, Dict, Optional, Tuple, Type
 
-from pydantic import EmailStr, Field, field_validator, model_validator
+from pydantic import BaseModel, EmailStr, Field, StringConstraints, field_validator, model_validator
 
 from app.schemas.base import BaseSchema
 from app.schemas.validators import normalize_name, normalize_username, validate_password_strength
 
+# Passwords are exempt from BaseSchema's str_strip_whitespace: leading and
+# trailing spaces are part of the secret. Stripping them at registration but
+# not at login (LoginRequest is a plain BaseModel) made such passwords
+# impossible to log in with.
+PasswordStr = Annotated[str, StringConstraints(strip_whitespace=False)]
+
 
 class UserCreateSchema(BaseSchema):
     """
@@ -63,7 +71,7 @@ class UserCreateSchema(BaseSchema):
 
     email: EmailStr = Field(..., description="Valid email address", examples=["john@example.com"])
 
-    password: str = Field(
+    password: PasswordStr = Field(
         ...,
         min_length=8,
         max_length=128,
@@ -124,7 +132,7 @@ class UserLoginSchema(BaseSchema):
 
     email: EmailStr = Field(..., description="User's email address", examples=["john@example.com"])
 
-    password: str = Field(
+    password: PasswordStr = Field(
         ...,
         min_length=1,  # Don't validate password strength on login
         description="User's password",
@@ -188,9 +196,9 @@ class UserUpdateSchema(BaseSchema):
         Raises:
             ValueError: If no fields are provided for update
         """
-        # Get all fields that were explicitly set (not None)
-        values = self.model_dump(exclude_unset=True)
-        if not values:
+        # Fields the client explicitly sent (pydantic records these while
+        # validating, so there's no need to dump the model to find out)
+        if not self.model_fields_set:
             raise ValueError("At least one field must be provided for update")
         return self
 
@@ -214,6 +222,9 @@ class UserResponseSchema(BaseSchema):
         user = User.query.get(1)  # SQLAlchemy model
         response = UserResponseSchema.model_validate(user)
         return jsonify(response.to_dict())
+
+        # Or, for users loaded from our own database (see serialize_orm):
+        return jsonify(UserResponseSchema.serialize_orm(user))
     """
 
     id: int = Field(description="Unique user identifier")
@@ -227,3 +238,41 @@ class UserResponseSchema(BaseSchema):
     is_deleted: bool = Field(description="Whether account is deleted (soft delete)")
     created_at: Optional[datetime] = Field(default=None, description="Account creation timestamp")
     updated_at: Optional[datetime] = Field(default=None, description="Last update timestamp")
+
+    @classmethod
+    def serialize_orm(cls, user: Any) -> Dict[str, Any]:
+        """
+        Serialize a trusted ORM user to a dict without re-validating it.
+
+        model_validate(user).to_dict() runs every field validator (including
+        the comparatively slow email validation) on data that came straight
+        out of our own database and was validated when it was written.
+        This reads the schema's fields directly from the ORM object instead,
+        producing the same dict many times faster.
+
+        Only use this for objects loaded from the database - never for
+        client input.
+
+        Args:
+            user: A User ORM instance
+
+        Returns:
+            dict: Same shape as model_validate(user).to_dict()
+        """
+        names, read_fields = _orm_field_reader(cls)
+        return dict(zip(names, read_fields(user)))
+
+
+@lru_cache(maxsize=None)
+def _orm_field_reader(
+    schema: Type[BaseModel],
+) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+    """
+    Build (field names, attribute reader) for a response schema, once per class.
+
+    attrgetter("a", "b", ...) reads every attribute in a single C call, which
+    is noticeably faster per row than a dict comprehension of getattr() calls.
+    Used by UserResponseSchema.serialize_orm().
+    """
+    names = tuple(schema.model_fields)
+    return names, attrgetter(*names)
@@ -74,10 +74,13 @@ def format_validation_errors(error: ValidationError) -> List[Dict[str, Any]]:
     """
     formatted_errors = []
 
-    for err in error.errors():
+    # Only loc/msg/type are used, so pydantic-core doesn't need to build the
+    # documentation URL, context or (possibly sensitive) input of each error
+    for err in error.errors(include_url=False, include_context=False, include_input=False):
         # loc is a tuple like ('username',) or ('address', 'city')
-        # We join with '.' for nested fields
-        field_path = ".".join(str(loc) for loc in err["loc"])
+        # We join with '.' for nested fields (most errors are top-level)
+        loc = err["loc"]
+        field_path = str(loc[0]) if len(loc) == 1 else ".".join(map(str, loc))
 
         formatted_errors.append({"field": field_path, "message": err["msg"], "type": err["type"]})
 
@@ -112,13 +115,16 @@ def validate_request(schema_class: Type[T]) -> Union[T, Tuple]:
 
     Flow:
     1. Get JSON from request
-    2. If no JSON → return 400 error
-    3. Try to create schema instance
+    2. If no (valid) JSON → return 400 error
+    3. Try to validate it into a schema instance
     4. If validation fails → return 422 error with details
     5. If success → return validated schema instance
     """
     # Step 1: Get JSON data from request
-    data = request.get_json()
+    # silent=True: a malformed body or non-JSON Content-Type gives None
+    # (handled just below) instead of raising; the parsed body is cached on
+    # the request, so later get_json() calls don't parse it again.
+    data = request.get_json(silent=True)
 
     # Step 2: Check if data exists
     if data is None:
@@ -134,8 +140,11 @@ def validate_request(schema_class: Type[T]) -> Union[T, Tuple]:
         )
 
     # Step 3: Try to validate
+    # model_validate() hands the parsed JSON straight to pydantic-core (no
+    # **kwargs copy), and a non-object body (e.g. a JSON list) becomes a
+    # normal 422 instead of a TypeError from schema_class(**data).
     try:
-        validated = schema_class(**data)
+        validated = schema_class.model_validate(data)
         return validated
 
     except ValidationError as e:
@@ -87,11 +87,27 @@ def validate_password_strength(v: str) -> str:
 
     Raises:
         ValueError: If password doesn't meet strength requirements
+
+    Note:
+        The three checks share one pass over the password, stopping as soon
+        as all three kinds of character have been seen (instead of one
+        any() generator per rule).
     """
-    if not any(c.isupper() for c in v):
+    has_upper = has_lower = has_digit = False
+    for c in v:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit:
+            return v
+
+    if not has_upper:
         raise ValueError("Password must contain at least one uppercase letter")
-    if not any(c.islower() for c in v):
+    if not has_lower:
         raise ValueError("Password must contain at least one lowercase letter")
-    if not any(c.isdigit() for c in v):
-        raise ValueError("Password must contain at least one digit")
-    return v
+    raise ValueError("Password must contain at least one digit")
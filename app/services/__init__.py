@@ -21,7 +21,7 @@ Usage:
     result = AuthService.login(email, password)
 
     # Logout
-    AuthService.logout(jti)
+    AuthService.logout(get_jwt())
 """
 
 from app.services.auth_service import (
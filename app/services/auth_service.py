@@ -18,7 +18,10 @@ Usage:
     result = AuthService.login(email, password)
 
     # Logout (revoke token)
-    AuthService.logout(jti)
+    AuthService.logout(get_jwt())
+
+    # Logout from every device (revoke all tokens)
+    AuthService.logout_all(user)
 
     # Refresh tokens
     tokens = AuthService.refresh_tokens(user)
@@ -27,9 +30,10 @@ Usage:
 import logging
 from typing import Any, Dict
 
-from app.auth import create_tokens, revoke_token
+from app import db
+from app.auth import create_tokens, invalidate_token_version, revoke_all_tokens, revoke_token
 from app.models.user import User
-from app.schemas.user import UserResponseSchema
+from app.schemas.user import UserCreateSchema, UserResponseSchema
 from app.services.user_service import InvalidCredentialsError, UserService
 
 logger = logging.getLogger(__name__)
@@ -125,9 +129,9 @@ class AuthService:
         tokens = create_tokens(user)
 
         # Step 3: Format user data
-        user_data = UserResponseSchema.model_validate(user).to_dict()
+        user_data = UserResponseSchema.serialize_orm(user)
 
-        logger.info(f"Login successful for user_id={user.id}")
+        logger.info("Login successful for user_id=%s", user.id)
 
         return {
             **tokens,
@@ -135,34 +139,61 @@ class AuthService:
         }
 
     @staticmethod
-    def logout(jti: str) -> None:
+    def logout(token: Dict[str, Any]) -> None:
         """
-        Logout by revoking (blacklisting) a token.
+        Logout by revoking (blocklisting) a token.
 
-        The token is added to a blacklist and cannot be used for
-        authentication anymore.
+        The token is added to the blocklist and cannot be used for
+        authentication anymore. It stays there only until its own expiry.
 
         Args:
-            jti: The JWT ID (jti claim) of the token to revoke.
-                 This is a unique identifier for each JWT.
+            token: The decoded JWT (as returned by get_jwt()). Its "jti"
+                   claim identifies the token and "exp" bounds how long it
+                   has to be remembered.
 
         Note:
-            - Currently uses in-memory blacklist (development only!)
-            - In production, should use Redis for distributed systems
+            - The blocklist backend is set by TOKEN_BLOCKLIST_URL
+              (memory:// per process, or redis:// shared by all workers)
             - Client should also discard both access and refresh tokens
 
         Example:
             from flask_jwt_extended import get_jwt
 
-            jti = get_jwt()["jti"]
-            AuthService.logout(jti)
+            AuthService.logout(get_jwt())
         """
         logger.info("Logout initiated")
 
-        revoke_token(jti)
+        revoke_token(token["jti"], token.get("exp"))
 
         logger.info("Logout successful - token revoked")
 
+    @staticmethod
+    def logout_all(user: User) -> None:
+        """
+        Logout from every device by revoking all of the user's tokens.
+
+        Increments the user's token_version, so every access and refresh
+        token issued before (which carries the old version in its "tv"
+        claim) is rejected. One UPDATE, no per-token bookkeeping.
+
+        Args:
+            user: The authenticated User object
+
+        Raises:
+            UserNotAuthenticatedError: If user is None
+
+        Example:
+            AuthService.logout_all(get_current_user())
+        """
+        if not user:
+            raise UserNotAuthenticatedError("User not found")
+
+        revoke_all_tokens(user.id)
+        db.session.commit()
+        invalidate_token_version(user.id)
+
+        logger.info("Logout from all devices for user_id=%s", user.id)
+
     @staticmethod
     def refresh_tokens(user: User) -> Dict[str, str]:
         """
@@ -192,11 +223,11 @@ class AuthService:
             logger.warning("Token refresh failed: user not found")
             raise UserNotAuthenticatedError("User not found")
 
-        logger.info(f"Refreshing tokens for user_id={user.id}")
+        logger.info("Refreshing tokens for user_id=%s", user.id)
 
         tokens = create_tokens(user)
 
-        logger.info(f"Tokens refreshed successfully for user_id={user.id}")
+        logger.info("Tokens refreshed successfully for user_id=%s", user.id)
 
         return tokens
 
@@ -226,20 +257,12 @@ class AuthService:
             logger.warning("Get user info failed: user not found")
             raise UserNotAuthenticatedError("User not found")
 
-        logger.debug(f"Fetching user info for user_id={user.id}")
+        logger.debug("Fetching user info for user_id=%s", user.id)
 
-        return UserResponseSchema.model_validate(user).to_dict()
+        return UserResponseSchema.serialize_orm(user)
 
     @staticmethod
-    def register(
-        username: str,
-        email: str,
-        password: str,
-        first_name: str,
-        middle_name: str = None,
-        last_name: str = None,
-        bio: str = None,
-    ) -> Dict[str, Any]:
+    def register(data: UserCreateSchema) -> Dict[str, Any]:
         """
         Register a new user account.
 
@@ -247,13 +270,9 @@ class AuthService:
         convenient interface for registration.
 
         Args:
-            username: Unique username (will be lowercased)
-            email: Unique email address
-            password: Password (will be hashed)
-            first_name: User's first name
-            middle_name: Optional middle name
-            last_name: Optional last name
-            bio: Optional user biography
+            data: Validated registration data. Routes pass the request body
+                flask-openapi3 already parsed; scripts build one with
+                UserCreateSchema(username=..., email=..., ...).
 
         Returns:
             Dict containing the created user's information
@@ -268,24 +287,11 @@ class AuthService:
             - Send welcome email
             - Create initial settings
         """
-        from app.schemas.user import UserCreateSchema
-
-        logger.info(f"Registration attempt for username={username}")
-
-        # Create schema for validation
-        user_data = UserCreateSchema(
-            username=username,
-            email=email,
-            password=password,
-            first_name=first_name,
-            middle_name=middle_name,
-            last_name=last_name,
-            bio=bio,
-        )
+        logger.info("Registration attempt for username=%s", data.username)
 
         # Delegate to UserService
-        user = UserService.create_user(user_data)
+        user = UserService.create_user(data)
 
-        logger.info(f"Registration successful for user_id={user.id}")
+        logger.info("Registration successful for user_id=%s", user.id)
 
-        return UserResponseSchema.model_validate(user).to_dict()
+        return UserResponseSchema.serialize_orm(user)
@@ -21,15 +21,32 @@ Usage:
     user = UserService.get_by_email("test@example.com")
 """
 
+import hashlib
+import hmac
 import logging
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import lazyload
 
 from app import db
 from app.models.user import User
-from app.schemas.user import UserCreateSchema, UserUpdateSchema
+from app.schemas.user import UserCreateSchema, UserResponseSchema, UserUpdateSchema
+from app.utils.cache import TTLCache
+from app.utils.pagination import estimated_count, paginate, paginate_after
 
 logger = logging.getLogger(__name__)
 
+# Serialized public profiles of active users, keyed by user ID.
+# Entries are dropped by every UserService method that changes a user.
+user_cache = TTLCache(maxsize=5000)
+
+# Recently verified logins: HMAC(SECRET_KEY, "<user_id>:<password>") -> the
+# password hash it was verified against. Only successful logins are stored.
+credential_cache = TTLCache(maxsize=5000)
+
 
 class UserServiceError(Exception):
     """Base exception for user service errors."""
@@ -58,6 +75,29 @@ class InvalidCredentialsError(UserServiceError):
     pass
 
 
+def _duplicate_field(error: IntegrityError) -> Optional[str]:
+    """
+    Work out which unique field ("username" or "email") an INSERT violated.
+
+    Args:
+        error: The IntegrityError raised by the database
+
+    Returns:
+        The field name, or None if the error isn't a username/email duplicate
+    """
+    # psycopg2 exposes the violated constraint/index name (e.g.
+    # "ix_users_users_email"); other drivers only give us the message
+    diag = getattr(error.orig, "diag", None)
+    source = getattr(diag, "constraint_name", None) or str(error.orig)
+    if diag is None and "unique" not in source.lower() and "duplicate" not in source.lower():
+        return None  # e.g. a NOT NULL violation that merely mentions the column
+
+    for field in ("email", "username"):
+        if field in source:
+            return field
+    return None
+
+
 class UserService:
     """
     Service class for user-related business logic.
@@ -90,17 +130,12 @@ class UserService:
         Raises:
             UserAlreadyExistsError: If username or email already exists
         """
-        logger.info(f"Creating user: {data.username}")
-
-        # Check for existing username
-        if User.query.filter_by(username=data.username, is_deleted=False).first():
-            logger.warning(f"Username already exists: {data.username}")
-            raise UserAlreadyExistsError("username", data.username)
+        logger.info("Creating user: %s", data.username)
 
-        # Check for existing email
-        if User.query.filter_by(email=data.email, is_deleted=False).first():
-            logger.warning(f"Email already exists: {data.email}")
-            raise UserAlreadyExistsError("email", data.email)
+        # No "does it exist?" SELECTs up front: the unique indexes on
+        # username/email reject duplicates at INSERT time (race-free, and one
+        # round-trip less for every successful registration).
+        # IntegrityError is translated to UserAlreadyExistsError below.
 
         # Create user
         user = User(
@@ -116,11 +151,20 @@ class UserService:
         try:
             db.session.add(user)
             db.session.commit()
-            logger.info(f"User created successfully: id={user.id}")
+            logger.info("User created successfully: id=%s", user.id)
             return user
+        except IntegrityError as e:
+            db.session.rollback()
+            field = _duplicate_field(e)
+            if field is None:
+                logger.error("Failed to create user: %s", e)
+                raise
+            value = data.username if field == "username" else data.email
+            logger.warning("%s already exists: %s", field.capitalize(), value)
+            raise UserAlreadyExistsError(field, value) from e
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Failed to create user: {e}")
+            logger.error("Failed to create user: %s", e)
             raise
 
     # =========================================================================
@@ -138,11 +182,16 @@ class UserService:
 
         Returns:
             User object or None if not found
+
+        Note:
+            Uses Session.get(), which returns the object straight from the
+            identity map when it's already loaded in this request (e.g. by
+            the JWT user loader) instead of issuing another SELECT.
         """
-        query = User.query.filter_by(id=user_id)
-        if not include_deleted:
-            query = query.filter_by(is_deleted=False)
-        return query.first()
+        user = db.session.get(User, user_id)
+        if user is None or (user.is_deleted and not include_deleted):
+            return None
+        return user
 
     @staticmethod
     def get_by_id_or_404(user_id: int, include_deleted: bool = False) -> User:
@@ -164,6 +213,32 @@ class UserService:
             raise UserNotFoundError(f"User with id={user_id} not found")
         return user
 
+    @staticmethod
+    def get_public_data(user_id: int) -> Dict[str, Any]:
+        """
+        Get an active user's public profile (UserResponseSchema fields), cached.
+
+        GET /users/<id> is the most frequently hit read. The serialized dict is
+        kept for USER_CACHE_TTL seconds, so repeated reads of the same user
+        skip both the SELECT and the serialization. update_user, soft_delete,
+        restore and hard_delete drop the entry, so changes made through this
+        service are visible immediately in this worker.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            dict: Same shape as UserResponseSchema.serialize_orm(user)
+
+        Raises:
+            UserNotFoundError: If user not found (misses are not cached)
+        """
+        return user_cache.get_or_set(
+            user_id,
+            lambda: UserResponseSchema.serialize_orm(UserService.get_by_id_or_404(user_id)),
+            ttl=current_app.config.get("USER_CACHE_TTL", 0),
+        )
+
     @staticmethod
     def get_by_email(email: str, include_deleted: bool = False) -> Optional[User]:
         """
@@ -215,17 +290,48 @@ class UserService:
         Returns:
             Tuple of (list of users, total count)
         """
-        query = User.query
+        stmt = select(User)
         if not include_deleted:
-            query = query.filter_by(is_deleted=False)
+            stmt = stmt.where(User.is_deleted.is_(False))
+
+        # One query returns both the page of users and the total count
+        return paginate(stmt.order_by(User.id), page, per_page)
+
+    @staticmethod
+    def get_after(
+        after_id: int = 0,
+        limit: int = 20,
+        include_deleted: bool = False,
+    ) -> Tuple[List[User], Optional[int]]:
+        """
+        Get the users following a given ID (keyset pagination).
+
+        Unlike get_all(), the cost doesn't grow with how deep the page is and
+        no total is counted - use this to walk through large user lists.
+
+        Args:
+            after_id: Return users with an ID greater than this (0 = start)
+            limit: Maximum number of users to return
+            include_deleted: If True, include soft-deleted users
+
+        Returns:
+            Tuple of (list of users, cursor for the next page or None)
+        """
+        stmt = select(User)
+        if not include_deleted:
+            stmt = stmt.where(User.is_deleted.is_(False))
 
-        # Get total count before pagination
-        total = query.count()
+        return paginate_after(stmt, User.id, after_id, limit)
 
-        # Apply pagination
-        users = query.order_by(User.id).offset((page - 1) * per_page).limit(per_page).all()
+    @staticmethod
+    def get_estimated_total() -> Optional[int]:
+        """
+        Approximate number of users (including soft-deleted), without a scan.
 
-        return users, total
+        Returns:
+            The planner's row estimate, or None if not yet analyzed
+        """
+        return estimated_count(User.__table__)
 
     # =========================================================================
     # AUTHENTICATION Operations
@@ -254,17 +360,68 @@ class UserService:
         """
         logger.info("Authentication attempt")
 
-        user = UserService.get_by_email(email)
+        # User.roles/direct_permissions are eager "selectin" relationships,
+        # which would cost three more queries (roles, their permissions,
+        # direct permissions) that a login never reads. Load them lazily here.
+        user = (
+            User.query.options(lazyload(User.roles), lazyload(User.direct_permissions))
+            .filter_by(email=email, is_deleted=False)
+            .first()
+        )
 
         # Security: Return same error for user not found AND wrong password
         # This prevents email enumeration attacks
-        if not user or not user.check_password(password):
+        if not user or not UserService._verify_password(user, password):
             logger.warning("Authentication failed: invalid credentials")
             raise InvalidCredentialsError("Invalid email or password")
 
-        logger.info(f"User authenticated successfully: user_id={user.id}")
+        logger.info("User authenticated successfully: user_id=%s", user.id)
         return user
 
+    @staticmethod
+    def _verify_password(user: User, password: str) -> bool:
+        """
+        Check a password, skipping the hash for a recently verified login.
+
+        Password hashing is deliberately slow (scrypt, tens of milliseconds),
+        and clients that log in repeatedly send the same credentials each
+        time. A successful check is remembered for CREDENTIAL_CACHE_TTL
+        seconds:
+        - The key is an HMAC of user ID + password under SECRET_KEY, so the
+          cache never holds a password or anything that can be brute-forced
+          without the secret key
+        - The value is the password hash that was verified; a hit only counts
+          if it still equals the user's current hash, so a password change
+          invalidates the entry immediately (in every worker)
+        - Failed attempts are never cached and always pay the full hash
+
+        Args:
+            user: The user loaded by email
+            password: The plain text password
+
+        Returns:
+            bool: True if the password matches
+        """
+        ttl = current_app.config.get("CREDENTIAL_CACHE_TTL", 0)
+        if ttl <= 0:
+            return user.check_password(password)
+
+        key = hmac.new(
+            current_app.config["SECRET_KEY"].encode(),
+            f"{user.id}:{password}".encode(),
+            hashlib.sha256,
+        ).digest()
+
+        verified_hash = credential_cache.get(key)
+        if verified_hash is not None and hmac.compare_digest(verified_hash, user.password_hash):
+            return True
+
+        if not user.check_password(password):
+            return False
+
+        credential_cache.set(key, user.password_hash, ttl)
+        return True
+
     # =========================================================================
     # UPDATE Operations
     # =========================================================================
@@ -274,6 +431,12 @@ class UserService:
         """
         Update a user's profile.
 
+        Like soft_delete(), this is a single statement with no SELECT first:
+
+            UPDATE users SET <changed fields>, updated_at = ...
+            WHERE id = :id AND is_deleted = false
+            RETURNING users.*
+
         Args:
             user_id: The user's ID
             data: Validated update data
@@ -284,24 +447,35 @@ class UserService:
         Raises:
             UserNotFoundError: If user not found
         """
-        user = UserService.get_by_id_or_404(user_id)
-
-        logger.info(f"Updating user: user_id={user_id}")
+        logger.info("Updating user: user_id=%s", user_id)
 
         # Get only fields that were set
         update_data = data.model_dump(exclude_unset=True)
-        logger.debug(f"Fields being updated: {list(update_data.keys())}")
-
-        for field, value in update_data.items():
-            setattr(user, field, value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fields being updated: %s", list(update_data))
+
+        stmt = (
+            update(User)
+            .where(User.id == user_id, User.is_deleted.is_(False))
+            .values(**update_data)
+            .returning(User)
+        )
 
         try:
+            user = db.session.scalars(stmt).one_or_none()
+            if user is None:
+                db.session.rollback()
+                raise UserNotFoundError(f"User with id={user_id} not found")
+
             db.session.commit()
-            logger.info(f"User updated successfully: user_id={user_id}")
+            user_cache.invalidate(user_id)
+            logger.info("User updated successfully: user_id=%s", user_id)
             return user
+        except UserNotFoundError:
+            raise
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Failed to update user: {e}")
+            logger.error("Failed to update user: %s", e)
             raise
 
     # =========================================================================
@@ -313,6 +487,15 @@ class UserService:
         """
         Soft delete a user.
 
+        The existence check and the update happen in one statement:
+
+            UPDATE users SET is_deleted = true, updated_at = ...
+            WHERE id = :id AND is_deleted = false
+            RETURNING users.*
+
+        If no row comes back, the user doesn't exist (or is already deleted),
+        so there is no separate SELECT before the UPDATE.
+
         Args:
             user_id: The user's ID
 
@@ -322,19 +505,30 @@ class UserService:
         Raises:
             UserNotFoundError: If user not found
         """
-        user = UserService.get_by_id_or_404(user_id)
-
-        logger.info(f"Soft-deleting user: user_id={user_id}")
+        logger.info("Soft-deleting user: user_id=%s", user_id)
 
-        user.soft_delete()
+        stmt = (
+            update(User)
+            .where(User.id == user_id, User.is_deleted.is_(False))
+            .values(is_deleted=True)
+            .returning(User)
+        )
 
         try:
+            user = db.session.scalars(stmt).one_or_none()
+            if user is None:
+                db.session.rollback()
+                raise UserNotFoundError(f"User with id={user_id} not found")
+
             db.session.commit()
-            logger.info(f"User soft-deleted successfully: user_id={user_id}")
+            user_cache.invalidate(user_id)
+            logger.info("User soft-deleted successfully: user_id=%s", user_id)
             return user
+        except UserNotFoundError:
+            raise
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Failed to soft-delete user: {e}")
+            logger.error("Failed to soft-delete user: %s", e)
             raise
 
     @staticmethod
@@ -342,6 +536,9 @@ class UserService:
         """
         Restore a soft-deleted user.
 
+        A single UPDATE ... RETURNING, like soft_delete(). Restoring a user
+        who isn't deleted is allowed (idempotent), so only the ID is matched.
+
         Args:
             user_id: The user's ID
 
@@ -351,21 +548,25 @@ class UserService:
         Raises:
             UserNotFoundError: If user not found
         """
-        user = UserService.get_by_id(user_id, include_deleted=True)
-        if not user:
-            raise UserNotFoundError(f"User with id={user_id} not found")
-
-        logger.info(f"Restoring user: user_id={user_id}")
+        logger.info("Restoring user: user_id=%s", user_id)
 
-        user.restore()
+        stmt = update(User).where(User.id == user_id).values(is_deleted=False).returning(User)
 
         try:
+            user = db.session.scalars(stmt).one_or_none()
+            if user is None:
+                db.session.rollback()
+                raise UserNotFoundError(f"User with id={user_id} not found")
+
             db.session.commit()
-            logger.info(f"User restored successfully: user_id={user_id}")
+            user_cache.invalidate(user_id)
+            logger.info("User restored successfully: user_id=%s", user_id)
             return user
+        except UserNotFoundError:
+            raise
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Failed to restore user: {e}")
+            logger.error("Failed to restore user: %s", e)
             raise
 
     @staticmethod
@@ -386,14 +587,15 @@ class UserService:
         if not user:
             raise UserNotFoundError(f"User with id={user_id} not found")
 
-        logger.warning(f"HARD DELETING user: user_id={user_id}")
+        logger.warning("HARD DELETING user: user_id=%s", user_id)
 
         try:
             db.session.delete(user)
             db.session.commit()
-            logger.info(f"User hard-deleted successfully: user_id={user_id}")
+            user_cache.invalidate(user_id)
+            logger.info("User hard-deleted successfully: user_id=%s", user_id)
             return True
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Failed to hard-delete user: {e}")
+            logger.error("Failed to hard-delete user: %s", e)
             raise
@@ -24,7 +24,10 @@ from app.utils.responses import (  # Response Schemas for OpenAPI
     MetaInfo,
     StandardErrorResponse,
     StandardSuccessResponse,
+    conditional_response,
     error_response,
+    not_found_response,
+    pagination_meta,
     success_response,
 )
 
@@ -32,7 +35,10 @@ __all__ = [
     # Response utilities
     "success_response",
     "error_response",
+    "not_found_response",
+    "conditional_response",
     "ErrorCode",
+    "pagination_meta",
     # Response schemas
     "StandardSuccessResponse",
     "StandardErrorResponse",
@@ -0,0 +1,148 @@
+"""
+In-Process Caching - A small, thread-safe TTL cache.
+
+Some data is read on almost every request but changes rarely (role lists,
+permission lists, ...). Re-running the same queries for it every time wastes
+database round-trips. This module provides a tiny time-based cache for that
+kind of data.
+
+How It Works:
+-------------
+- Each entry is stored with an expiry time (time.monotonic() + ttl)
+- Expired entries are treated as missing and replaced on the next lookup
+- Writers that change the underlying data call invalidate()/invalidate_prefix()
+  so readers in the same process see the change immediately
+- A lock makes it safe to use from threaded servers (gunicorn --threads)
+
+Scope & Limitations:
+--------------------
+The cache lives in each worker process. With several gunicorn workers, an
+invalidation in one worker doesn't reach the others - they will only see the
+change once their entry expires. Keep TTLs short (seconds, not hours) for
+data that can be modified through the API. For a shared cache across
+processes/hosts, back this interface with Redis instead.
+
+Usage:
+    from app.utils.cache import TTLCache
+
+    role_cache = TTLCache(maxsize=256)
+
+    data = role_cache.get_or_set("role:list:1:20", load_roles, ttl=30)
+
+    # After modifying roles
+    role_cache.invalidate_prefix("role:list:")
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Sentinel for "not in cache" (None is a valid cached value)
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe key/value cache with per-entry time-to-live.
+
+    Attributes:
+        maxsize: Maximum number of entries. When full, expired entries are
+            purged first; if still full, the oldest entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value, or `default` if it's missing or expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            The cached value or `default`
+        """
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Store a value for `ttl` seconds.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds (<= 0 stores nothing)
+        """
+        if ttl <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict(now)
+            self._data[key] = (now + ttl, value)
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], T], ttl: float) -> T:
+        """
+        Return the cached value for `key`, calling `loader()` on a miss.
+
+        This is the usual "cache-aside" pattern:
+        1. Look in the cache
+        2. On a miss, load from the source of truth
+        3. Store the result for next time
+
+        Args:
+            key: Cache key
+            loader: Zero-argument function that produces the value
+            ttl: Time to live in seconds (<= 0 disables caching)
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry (no-op if it isn't cached)."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Remove every string key starting with `prefix`.
+
+        Args:
+            prefix: Key prefix, e.g. "role:list:"
+        """
+        with self._lock:
+            for key in [k for k in self._data if isinstance(k, str) and k.startswith(prefix)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self, now: float) -> None:
+        """Make room for one entry. Caller must hold the lock."""
+        for key in [k for k, (expires, _) in self._data.items() if expires <= now]:
+            del self._data[key]
+
+        if len(self._data) >= self.maxsize:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._data[next(iter(self._data))]
@@ -78,8 +78,9 @@ Flow Diagram:
 """
 
 import logging
+from typing import Any, Callable, Dict, List, Tuple
 
-from flask import Flask, jsonify, make_response
+from flask import Flask, jsonify
 from pydantic import ValidationError
 
 # SQLAlchemy exception imports for database error handling
@@ -107,10 +108,142 @@ from app.utils.responses import ErrorCode, error_response
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# HTTP Error Table
+# =============================================================================
+
+# Error code reported for each HTTP status (used by the HTTPException catch-all)
+_HTTP_ERROR_CODES: Dict[int, ErrorCode] = {
+    400: ErrorCode.BAD_REQUEST,
+    401: ErrorCode.UNAUTHORIZED,
+    403: ErrorCode.FORBIDDEN,
+    404: ErrorCode.NOT_FOUND,
+    405: ErrorCode.METHOD_NOT_ALLOWED,
+    409: ErrorCode.CONFLICT,
+    422: ErrorCode.VALIDATION_ERROR,
+    429: ErrorCode.RATE_LIMIT_EXCEEDED,
+    500: ErrorCode.INTERNAL_ERROR,
+}
+
+# Status codes whose handler only logs and returns a fixed error:
+# (status, error code, message, log level, use error.description as message)
+#
+# - 400: invalid JSON, missing headers, malformed syntax
+# - 401: missing/invalid/expired token
+# - 403: authenticated but lacking permission
+# - 404: unknown route, or a resource lookup (get_or_404) failed
+# - 405: e.g. POST to a GET-only endpoint
+# - 409: duplicate unique value, resource state conflict
+# - 429: rate limit exceeded
+_HTTP_ERROR_HANDLERS: Tuple[Tuple[int, ErrorCode, str, int, bool], ...] = (
+    (400, ErrorCode.BAD_REQUEST, "Bad request", logging.WARNING, True),
+    (401, ErrorCode.UNAUTHORIZED, "Authentication required", logging.WARNING, False),
+    (
+        403,
+        ErrorCode.FORBIDDEN,
+        "You do not have permission to access this resource",
+        logging.WARNING,
+        False,
+    ),
+    (404, ErrorCode.NOT_FOUND, "The requested resource was not found", logging.INFO, False),
+    (
+        405,
+        ErrorCode.METHOD_NOT_ALLOWED,
+        "Method not allowed for this endpoint",
+        logging.WARNING,
+        False,
+    ),
+    (409, ErrorCode.CONFLICT, "Resource conflict", logging.WARNING, True),
+    (
+        429,
+        ErrorCode.RATE_LIMIT_EXCEEDED,
+        "Too many requests. Please try again later.",
+        logging.WARNING,
+        False,
+    ),
+)
+
+
+def _make_http_error_handler(
+    status_code: int, error_code: ErrorCode, message: str, log_level: int, use_description: bool
+) -> Callable:
+    """
+    Build the handler for one row of _HTTP_ERROR_HANDLERS.
+
+    Args:
+        status_code: HTTP status of the response
+        error_code: Error code for the response body
+        message: Fixed message (or fallback when use_description is set)
+        log_level: Level to log the error at
+        use_description: Report the exception's description instead of
+            `message` when it has one
+
+    Returns:
+        An error handler function for app.register_error_handler()
+    """
+
+    label = error_code.value
+
+    def handle_http_error(error):
+        logger.log(log_level, "%s: %s", label, error)
+        text = message
+        if use_description and getattr(error, "description", None) is not None:
+            text = str(error.description)
+        return error_response(code=error_code, message=text, status_code=status_code)
+
+    return handle_http_error
+
+
+# Client-safe messages for IntegrityError, keyed by PostgreSQL SQLSTATE
+# (psycopg2 exposes it as error.orig.pgcode)
+_INTEGRITY_ERROR_MESSAGES: Dict[str, str] = {
+    "23505": "A record with this information already exists",  # unique_violation
+    "23503": "Referenced record does not exist",  # foreign_key_violation
+    "23502": "Required information is missing",  # not_null_violation
+}
+_INTEGRITY_ERROR_DEFAULT = "The operation could not be completed due to a data conflict"
+
+
 # =============================================================================
 # Pydantic Validation Error Callback (for flask-openapi3)
 # =============================================================================
 
+# The callback builds its body by hand (it must return a Response object), so
+# the enum's string value is looked up once here rather than per request
+_VALIDATION_ERROR_CODE = ErrorCode.VALIDATION_ERROR.value
+
+
+def _validation_error_details(error: ValidationError) -> Dict[str, Any]:
+    """
+    Map each failing field to its error message(s).
+
+    Shared by the flask-openapi3 callback and the ValidationError handler.
+    Pydantic is asked not to build the parts of each error we never use
+    (documentation URL, context, rejected input), which also keeps
+    submitted values such as passwords out of the error objects.
+
+    Args:
+        error: The Pydantic ValidationError instance
+
+    Returns:
+        dict: {"field": "message"} or {"field": ["message", ...]} when a
+        field failed more than one check
+    """
+    # Collect messages per field first, then unwrap single messages, so the
+    # loop needs no "already a list?" check per error
+    grouped: Dict[str, List[str]] = {}
+    for err in error.errors(include_url=False, include_context=False, include_input=False):
+        loc = err["loc"]
+        if len(loc) == 1 and loc[0] != "body":
+            # Fast path: most errors are on a top-level field
+            field = str(loc[0])
+        else:
+            # Skip 'body' in location, take the actual field name
+            field = ".".join([str(loc_part) for loc_part in loc if loc_part != "body"])
+        grouped.setdefault(field or "unknown", []).append(err["msg"])
+
+    return {field: msgs[0] if len(msgs) == 1 else msgs for field, msgs in grouped.items()}
+
 
 def pydantic_validation_error_callback(error: ValidationError):
     """
@@ -163,40 +296,26 @@ def pydantic_validation_error_callback(error: ValidationError):
         }
     """
     # Transform Pydantic errors to our format
-    details = {}
-    for err in error.errors():
-        # Get field name from location tuple
-        loc = err.get("loc", ())
-        # Skip 'body' in location, take the actual field name
-        field = ".".join(str(loc_part) for loc_part in loc if loc_part != "body") or "unknown"
-        message = err.get("msg", "Validation failed")
-
-        if field in details:
-            # Multiple errors for same field
-            if isinstance(details[field], list):
-                details[field].append(message)
-            else:
-                details[field] = [details[field], message]
-        else:
-            details[field] = message
+    details = _validation_error_details(error)
 
     # Log the validation error
-    logger.warning(f"Pydantic validation failed: {details}")
+    logger.warning("Pydantic validation failed: %s", details)
 
     # Build the response body in our standard format
     response_body = {
         "success": False,
         "data": None,
         "error": {
-            "code": ErrorCode.VALIDATION_ERROR.value,
+            "code": _VALIDATION_ERROR_CODE,
             "message": "Validation failed",
             "details": details,
         },
         "meta": None,
     }
 
-    # Create and return a proper Response object with 422 status
-    response = make_response(jsonify(response_body), 422)
+    # jsonify() already returns a Response object; just set the 422 status
+    response = jsonify(response_body)
+    response.status_code = 422
     return response
 
 
@@ -222,106 +341,9 @@ def register_error_handlers(app: Flask) -> None:
     # HTTP Error Handlers (4xx, 5xx)
     # =========================================================================
 
-    @app.errorhandler(400)
-    def handle_bad_request(error):
-        """
-        Handle 400 Bad Request errors.
-
-        Triggered when:
-        - Invalid JSON in request body
-        - Missing required headers
-        - Malformed request syntax
-        """
-        logger.warning(f"Bad Request: {error}")
-        return error_response(
-            code=ErrorCode.BAD_REQUEST,
-            message=(str(error.description) if hasattr(error, "description") else "Bad request"),
-            status_code=400,
-        )
-
-    @app.errorhandler(401)
-    def handle_unauthorized(error):
-        """
-        Handle 401 Unauthorized errors.
-
-        Triggered when:
-        - Missing authentication token
-        - Invalid token
-        - Token expired
-        """
-        logger.warning(f"Unauthorized: {error}")
-        return error_response(
-            code=ErrorCode.UNAUTHORIZED,
-            message="Authentication required",
-            status_code=401,
-        )
-
-    @app.errorhandler(403)
-    def handle_forbidden(error):
-        """
-        Handle 403 Forbidden errors.
-
-        Triggered when:
-        - User authenticated but lacks permission
-        - Resource access denied
-        """
-        logger.warning(f"Forbidden: {error}")
-        return error_response(
-            code=ErrorCode.FORBIDDEN,
-            message="You do not have permission to access this resource",
-            status_code=403,
-        )
-
-    @app.errorhandler(404)
-    def handle_not_found(error):
-        """
-        Handle 404 Not Found errors.
-
-        Triggered when:
-        - Route doesn't exist
-        - Resource not found in database
-        - get_or_404() fails
-        """
-        logger.info(f"Not Found: {error}")
-        return error_response(
-            code=ErrorCode.NOT_FOUND,
-            message="The requested resource was not found",
-            status_code=404,
-        )
-
-    @app.errorhandler(405)
-    def handle_method_not_allowed(error):
-        """
-        Handle 405 Method Not Allowed errors.
-
-        Triggered when:
-        - POST to a GET-only endpoint
-        - DELETE to a read-only resource
-        """
-        logger.warning(f"Method Not Allowed: {error}")
-        return error_response(
-            code=ErrorCode.METHOD_NOT_ALLOWED,
-            message="Method not allowed for this endpoint",
-            status_code=405,
-        )
-
-    @app.errorhandler(409)
-    def handle_conflict(error):
-        """
-        Handle 409 Conflict errors.
-
-        Triggered when:
-        - Duplicate unique constraint
-        - Resource state conflict
-        """
-        logger.warning(f"Conflict: {error}")
-        return error_response(
-            code=ErrorCode.CONFLICT,
-            message=(
-                str(error.description) if hasattr(error, "description") else "Resource conflict"
-            ),
-            status_code=409,
-        )
+    # Plain 4xx errors differ only in their data - see _HTTP_ERROR_HANDLERS
+    for row in _HTTP_ERROR_HANDLERS:
+        app.register_error_handler(row[0], _make_http_error_handler(*row))
 
     @app.errorhandler(422)
     def handle_unprocessable_entity(error):
@@ -344,21 +366,6 @@ def register_error_handlers(app: Flask) -> None:
             status_code=422,
         )
 
-    @app.errorhandler(429)
-    def handle_rate_limit(error):
-        """
-        Handle 429 Too Many Requests errors.
-
-        Triggered when:
-        - Rate limiting is exceeded
-        """
-        logger.warning(f"Rate Limit Exceeded: {error}")
-        return error_response(
-            code=ErrorCode.RATE_LIMIT_EXCEEDED,
-            message="Too many requests. Please try again later.",
-            status_code=429,
-        )
-
     @app.errorhandler(500)
     def handle_internal_error(error):
         """
@@ -371,7 +378,7 @@ def register_error_handlers(app: Flask) -> None:
 
         SECURITY: Never expose stack traces to clients in production!
         """
-        logger.error(f"Internal Server Error: {error}", exc_info=True)
+        logger.error("Internal Server Error: %s", error, exc_info=True)
 
         # In development, include more details
         # In production, return generic message
@@ -401,22 +408,9 @@ def register_error_handlers(app: Flask) -> None:
         This is a catch-all for any HTTP exceptions not explicitly handled above.
         Werkzeug raises these for various HTTP errors.
         """
-        logger.warning(f"HTTP Exception: {error.code} - {error.description}")
-
-        # Map HTTP status codes to error codes
-        code_map = {
-            400: ErrorCode.BAD_REQUEST,
-            401: ErrorCode.UNAUTHORIZED,
-            403: ErrorCode.FORBIDDEN,
-            404: ErrorCode.NOT_FOUND,
-            405: ErrorCode.METHOD_NOT_ALLOWED,
-            409: ErrorCode.CONFLICT,
-            422: ErrorCode.VALIDATION_ERROR,
-            429: ErrorCode.RATE_LIMIT_EXCEEDED,
-            500: ErrorCode.INTERNAL_ERROR,
-        }
+        logger.warning("HTTP Exception: %s - %s", error.code, error.description)
 
-        error_code = code_map.get(error.code, ErrorCode.INTERNAL_ERROR)
+        error_code = _HTTP_ERROR_CODES.get(error.code, ErrorCode.INTERNAL_ERROR)
 
         return error_response(
             code=error_code,
@@ -444,25 +438,10 @@ def register_error_handlers(app: Flask) -> None:
             }
         ]
         """
-        logger.info(f"Pydantic Validation Error: {error}")
+        logger.info("Pydantic Validation Error: %s", error)
 
         # Transform Pydantic errors to our format
-        details = {}
-        for err in error.errors():
-            # Get field name from location tuple
-            loc = err.get("loc", ())
-            # Skip 'body' in location, take the actual field name
-            field = ".".join(str(loc_part) for loc_part in loc if loc_part != "body") or "unknown"
-            message = err.get("msg", "Validation failed")
-
-            if field in details:
-                # Multiple errors for same field
-                if isinstance(details[field], list):
-                    details[field].append(message)
-                else:
-                    details[field] = [details[field], message]
-            else:
-                details[field] = message
+        details = _validation_error_details(error)
 
         return error_response(
             code=ErrorCode.VALIDATION_ERROR,
@@ -488,7 +467,8 @@ def register_error_handlers(app: Flask) -> None:
         - @permission_required decorator check fails
         """
         logger.warning(
-            f"Permission denied: {error.message}",
+            "Permission denied: %s",
+            error.message,
             extra={
                 "error_type": "PermissionDeniedError",
                 "required_permissions": error.required_permissions,
@@ -516,7 +496,8 @@ def register_error_handlers(app: Flask) -> None:
         - Role lookup fails
         """
         logger.info(
-            f"Role not found: {error.message}",
+            "Role not found: %s",
+            error.message,
             extra={
                 "error_type": "RoleNotFoundError",
                 "role_name": error.role_name,
@@ -540,7 +521,8 @@ def register_error_handlers(app: Flask) -> None:
         - Permission lookup fails
         """
         logger.info(
-            f"Permission not found: {error.message}",
+            "Permission not found: %s",
+            error.message,
             extra={
                 "error_type": "PermissionNotFoundError",
                 "permission_name": error.permission_name,
@@ -564,7 +546,8 @@ def register_error_handlers(app: Flask) -> None:
         - Role name already exists (when creating)
         """
         logger.warning(
-            f"Role assignment error: {error.message}",
+            "Role assignment error: %s",
+            error.message,
             extra={
                 "error_type": "RoleAssignmentError",
                 "user_id": error.user_id,
@@ -588,7 +571,8 @@ def register_error_handlers(app: Flask) -> None:
         - Attempting to modify protected system role
         """
         logger.warning(
-            f"System role error: {error.message}",
+            "System role error: %s",
+            error.message,
             extra={
                 "error_type": "SystemRoleError",
                 "role_name": error.role_name,
@@ -611,7 +595,8 @@ def register_error_handlers(app: Flask) -> None:
         - User doesn't have the direct permission being revoked
         """
         logger.warning(
-            f"Direct permission error: {error.message}",
+            "Direct permission error: %s",
+            error.message,
             extra={
                 "error_type": "DirectPermissionError",
                 "user_id": error.user_id,
@@ -634,7 +619,8 @@ def register_error_handlers(app: Flask) -> None:
         More specific handlers above take precedence.
         """
         logger.error(
-            f"Unhandled RBAC Error: {error.message}",
+            "Unhandled RBAC Error: %s",
+            error.message,
             extra={
                 "error_type": type(error).__name__,
                 "error_code": error.code,
@@ -686,19 +672,8 @@ def register_error_handlers(app: Flask) -> None:
 
         # Provide helpful but safe message based on error type
         # Note: We never expose the actual constraint name or table
-        if error.orig:
-            orig_message = str(error.orig).lower()
-
-            if "unique" in orig_message or "duplicate" in orig_message:
-                message = "A record with this information already exists"
-            elif "foreign key" in orig_message or "fk_" in orig_message:
-                message = "Referenced record does not exist"
-            elif "not null" in orig_message or "notnull" in orig_message:
-                message = "Required information is missing"
-            else:
-                message = "The operation could not be completed due to a data conflict"
-        else:
-            message = "The operation could not be completed due to a data conflict"
+        sqlstate = getattr(error.orig, "pgcode", None)
+        message = _INTEGRITY_ERROR_MESSAGES.get(sqlstate, _INTEGRITY_ERROR_DEFAULT)
 
         return error_response(
             code=ErrorCode.CONFLICT,
@@ -800,7 +775,8 @@ def register_error_handlers(app: Flask) -> None:
         More specific handlers above take precedence.
         """
         logger.error(
-            f"Unhandled SQLAlchemy Error: {type(error).__name__}",
+            "Unhandled SQLAlchemy Error: %s",
+            type(error).__name__,
             exc_info=True,
             extra={
                 "error_type": type(error).__name__,
@@ -831,7 +807,9 @@ def register_error_handlers(app: Flask) -> None:
         Instead, we log everything server-side where developers can see it.
         """
         logger.error(
-            f"Unhandled Exception: {type(error).__name__}: {error}",
+            "Unhandled Exception: %s: %s",
+            type(error).__name__,
+            error,
             exc_info=True,
             extra={
                 "error_type": type(error).__name__,
@@ -0,0 +1,93 @@
+"""
+Health Checks - A cached database liveness probe shared by all health endpoints.
+
+Both the JSON health endpoint (/api/v1/health) and the HTML dashboard
+(/health) report whether the database is reachable. Orchestrators
+(Kubernetes liveness/readiness probes, load balancers, uptime monitors) can
+call these many times per second across every pod. Running `SELECT 1` for
+each call would take a pooled connection away from real traffic every time.
+
+How It Works:
+-------------
+- The result of the last `SELECT 1` is kept for HEALTH_CHECK_TTL_SECONDS
+- Within that window, callers get the stored status without touching the DB
+- When it expires, ONE caller re-checks while concurrent callers keep
+  returning the previous status (a probe storm never queues on the database)
+- Only the very first check makes concurrent callers wait, since there is
+  no previous status to return yet
+- The check borrows a connection straight from the engine and returns it
+  immediately, instead of holding the request's session connection
+
+Why not a background thread?
+    A polling thread would keep querying even when nobody asks, has to be
+    restarted in every gunicorn worker after fork, and needs its own app
+    context. Checking lazily on demand gives the same "at most one query per
+    TTL" guarantee without any of that.
+
+Usage:
+    from app.utils.health import check_database
+
+    db_status = check_database()  # "connected" or "disconnected"
+"""
+
+import logging
+import threading
+import time
+from typing import Tuple
+
+from app import db
+
+logger = logging.getLogger(__name__)
+
+# Liveness probes can hit the health endpoints many times per second. Caching
+# the database check for a couple of seconds keeps those probes from competing
+# with real requests for pooled connections.
+HEALTH_CHECK_TTL_SECONDS = 2.0
+
+# (monotonic timestamp of the last check, database status at that time)
+_last_check: Tuple[float, str] = (float("-inf"), "disconnected")
+
+# Held by the one caller that is refreshing the status
+_refresh_lock = threading.Lock()
+
+
+def check_database() -> str:
+    """
+    Return the database status, re-checking at most once per TTL.
+
+    Uses time.monotonic() so the cache is unaffected by wall-clock changes.
+
+    Returns:
+        str: "connected" or "disconnected"
+    """
+    global _last_check
+
+    checked_at, db_status = _last_check
+    if time.monotonic() - checked_at < HEALTH_CHECK_TTL_SECONDS:
+        return db_status
+
+    # Someone else is already re-checking - serve the previous result. Before
+    # the first check there is no result to serve, so wait for it instead.
+    first_check = checked_at == float("-inf")
+    if not _refresh_lock.acquire(blocking=first_check):
+        return db_status
+
+    try:
+        # A caller that waited for the first check can use its result
+        checked_at, db_status = _last_check
+        if time.monotonic() - checked_at < HEALTH_CHECK_TTL_SECONDS:
+            return db_status
+
+        # Actually check database connection
+        try:
+            with db.engine.connect() as conn:
+                conn.execute(db.text("SELECT 1"))
+            db_status = "connected"
+        except Exception as e:
+            logger.error("Database health check failed: %s", e)
+            db_status = "disconnected"
+
+        _last_check = (time.monotonic(), db_status)
+        return db_status
+    finally:
+        _refresh_lock.release()
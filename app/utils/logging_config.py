@@ -59,16 +59,20 @@ Security Considerations:
 - Error messages are sanitized before logging to remove potential secrets
 """
 
+import atexit
+import copy
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 import uuid
 from datetime import datetime, timezone
 from functools import wraps
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
+import orjson
 from flask import Flask, g, has_request_context, request
 
 # =============================================================================
@@ -149,6 +153,12 @@ LEVEL_COLORS = {
     "CRITICAL": LogColors.BOLD + LogColors.MAGENTA,
 }
 
+# Padded, colorized level names, built once instead of on every record.
+# The -8s in format string pads to 8 chars, so we pad here too.
+COLORED_LEVELNAMES = {
+    level: f"{color}{level:<8}{LogColors.RESET}" for level, color in LEVEL_COLORS.items()
+}
+
 # Default log format for console (human-readable)
 # Note: levelname padding is handled by the formatter for proper color code alignment
 CONSOLE_FORMAT = (
@@ -196,6 +206,19 @@ def get_request_path() -> str:
     return "-"
 
 
+def get_request_context() -> Tuple[str, str, str]:
+    """
+    Get the current request ID, HTTP method and path in one call.
+
+    Returns:
+        Tuple of (request_id, method, path), with the same placeholders as
+        the individual getters outside a request context
+    """
+    if has_request_context():
+        return getattr(g, "request_id", "unknown"), request.method, request.path
+    return "no-request", "-", "-"
+
+
 # =============================================================================
 # Sensitive Data Masking
 # =============================================================================
@@ -249,6 +272,38 @@ def mask_sensitive_data(data: Any, depth: int = 0, max_depth: int = 10) -> Any:
 # Custom Log Formatter - JSON
 # =============================================================================
 
+# Attributes every LogRecord has; anything else on a record came from extra={}
+STANDARD_LOG_RECORD_ATTRS = frozenset(
+    [
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "exc_info",
+        "exc_text",
+        "thread",
+        "threadName",
+        "taskName",
+        "message",
+    ]
+)
+
+# orjson serializes datetimes itself ("...Z" for UTC) and accepts non-string
+# keys in masked "extra" dicts; anything else unknown falls back to str()
+_ORJSON_LOG_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -272,14 +327,21 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as a JSON string."""
+        # Records from the file queue carry the request context captured on
+        # the request thread; the listener thread has no request context
+        context = getattr(record, "_request_context", None)
+        if context is None:
+            context = get_request_context()
+        request_id, method, path = context
+
         # Build base log structure
         log_dict = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "logger": record.name,
-            "request_id": get_request_id(),
-            "method": get_request_method(),
-            "path": get_request_path(),
+            "request_id": request_id,
+            "method": method,
+            "path": path,
             "message": record.getMessage(),
         }
 
@@ -289,41 +351,21 @@ class JSONFormatter(logging.Formatter):
 
         # Add any extra fields from the record
         # Skip standard LogRecord attributes
-        standard_attrs = {
-            "name",
-            "msg",
-            "args",
-            "created",
-            "filename",
-            "funcName",
-            "levelname",
-            "levelno",
-            "lineno",
-            "module",
-            "msecs",
-            "pathname",
-            "process",
-            "processName",
-            "relativeCreated",
-            "stack_info",
-            "exc_info",
-            "exc_text",
-            "thread",
-            "threadName",
-            "taskName",
-            "message",
-        }
-
         extra = {}
         for key, value in record.__dict__.items():
-            if key not in standard_attrs and not key.startswith("_"):
+            if key not in STANDARD_LOG_RECORD_ATTRS and not key.startswith("_"):
                 extra[key] = value
 
         if extra:
             # Mask sensitive data in extra fields
             log_dict["extra"] = mask_sensitive_data(extra)
 
-        return json.dumps(log_dict, default=str)
+        try:
+            return orjson.dumps(log_dict, default=str, option=_ORJSON_LOG_OPTIONS).decode()
+        except TypeError:
+            # e.g., an int beyond 64 bits in "extra" - never lose a log line
+            log_dict["timestamp"] = log_dict["timestamp"].isoformat()
+            return json.dumps(log_dict, default=str)
 
 
 # =============================================================================
@@ -372,16 +414,15 @@ class ColoredRequestContextFormatter(RequestContextFormatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record with colored log level only."""
-        # Get color for this log level
-        color = LEVEL_COLORS.get(record.levelname, "")
+        # Get the precomputed colored name for this log level
+        colored_levelname = COLORED_LEVELNAMES.get(record.levelname)
 
-        if color:
+        if colored_levelname:
             # Save original levelname
             original_levelname = record.levelname
 
             # Wrap ONLY the levelname with color codes
-            # The -8s in format string pads to 8 chars, so we pad here too
-            record.levelname = f"{color}{record.levelname:<8}{LogColors.RESET}"
+            record.levelname = colored_levelname
 
             # Format with colored levelname
             formatted = super().format(record)
@@ -394,6 +435,64 @@ class ColoredRequestContextFormatter(RequestContextFormatter):
         return super().format(record)
 
 
+# =============================================================================
+# Queued File Output
+# =============================================================================
+# Writing to the log file (and formatting tracebacks for it) happens on a
+# background thread, so a request that logs an error doesn't wait on disk I/O:
+#
+#   logger.error(...) -> RequestContextQueueHandler -> SimpleQueue
+#                                                        |
+#                          QueueListener thread -> TimedRotatingFileHandler
+
+
+class RequestContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that defers formatting to the listener thread.
+
+    The stdlib QueueHandler formats each record (traceback included) before
+    queuing it, which is exactly the work we want off the request thread.
+    This handler only does what can't be done later:
+
+    - Merges msg and args, since args may be mutated after the call returns
+    - Captures the request context, which only exists on the request thread
+
+    exc_info is passed through so the listener's JSONFormatter formats the
+    traceback. Records never leave the process, so they don't need to be
+    picklable.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of the record that is safe to format on another thread."""
+        # Copy so the console handler (and any other handler) sees the original
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record._request_context = get_request_context()
+        return record
+
+
+# Listener writing queued records to the log file (one per process)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records to disk, stop the listener and close its handlers."""
+    global _queue_listener
+
+    listener, _queue_listener = _queue_listener, None
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+# Write out whatever is still queued when the interpreter exits
+atexit.register(_stop_queue_listener)
+
+
 # =============================================================================
 # Request Logging Middleware
 # =============================================================================
@@ -508,7 +607,8 @@ def setup_logging(app: Flask) -> None:
     This function configures:
     1. Root logger with appropriate level
     2. Console handler (human-readable in dev, JSON in production)
-    3. File handler with daily rotation (JSON format)
+    3. File handler with daily rotation (JSON format), written by a
+       background thread via a queue
     4. Request logging middleware
 
     File Naming:
@@ -525,6 +625,8 @@ def setup_logging(app: Flask) -> None:
             # ... rest of setup
             return app
     """
+    global _queue_listener
+
     # Determine environment
     is_debug = app.debug
     log_level_str = os.environ.get("LOG_LEVEL", "DEBUG" if is_debug else "INFO")
@@ -589,7 +691,20 @@ def setup_logging(app: Flask) -> None:
 
     file_handler.setLevel(log_level)
     file_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(file_handler)
+
+    # The root logger only gets a queue handler; a background listener thread
+    # formats and writes the records. setup_logging() may run more than once
+    # (e.g., one app per test), so the previous listener is stopped first.
+    _stop_queue_listener()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    queue_handler = RequestContextQueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    root_logger.addHandler(queue_handler)
 
     # Suppress noisy loggers from third-party libraries
     logging.getLogger("werkzeug").setLevel(logging.WARNING)
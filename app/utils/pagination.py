@@ -0,0 +1,139 @@
+"""
+Pagination Utilities - Offset pages with a total count, or keyset pages.
+
+The classic way to paginate is two queries:
+
+    total = query.count()                                  # SELECT count(*) ...
+    rows = query.offset(...).limit(...).all()              # SELECT ... LIMIT/OFFSET
+
+That's two round-trips to PostgreSQL and two scans of the same filtered rows.
+A window function lets the database return the total alongside every row of
+the page in a single query:
+
+    SELECT users.*, count(*) OVER () AS _total
+    FROM users WHERE ... ORDER BY id LIMIT 20 OFFSET 40
+
+`count(*) OVER ()` is evaluated before LIMIT/OFFSET, so every returned row
+carries the total number of matching rows.
+
+Keyset ("seek") Pagination:
+----------------------------
+OFFSET still makes PostgreSQL walk and discard every row before the page, so
+deep pages get slower and slower. For clients that just iterate through a
+list, paginate_after() continues from the last key seen instead:
+
+    SELECT users.* FROM users WHERE ... AND id > 40 ORDER BY id LIMIT 21
+
+That's an index range scan whose cost doesn't depend on how far in the page
+is. There's no exact total (counting is the expensive part), but
+estimated_count() reads the planner's row estimate for free.
+
+Usage:
+    from app.utils.pagination import paginate, paginate_after
+
+    stmt = select(User).where(User.is_deleted.is_(False)).order_by(User.id)
+    users, total = paginate(stmt, page=2, per_page=20)
+
+    stmt = select(User).where(User.is_deleted.is_(False))
+    users, next_cursor = paginate_after(stmt, User.id, after=40, limit=20)
+"""
+
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Select, Table, func, select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app import db
+
+
+def paginate(stmt: Select, page: int, per_page: int) -> Tuple[List[Any], int]:
+    """
+    Execute a select for one page, returning rows and total count.
+
+    Args:
+        stmt: A select() with filters and ORDER BY applied (but no
+            LIMIT/OFFSET). Usually a single ORM entity; extra columns
+            (e.g., an aggregated subquery) are allowed too.
+        page: Page number (1-indexed)
+        per_page: Number of rows per page
+
+    Returns:
+        Tuple of (list of items for the page, total matching rows). Each item
+        is the ORM object for a single-entity select, or a tuple of the
+        selected columns otherwise.
+
+    Note:
+        If the requested page is past the end, the windowed query returns no
+        rows (and therefore no total). Only in that case do we fall back to a
+        separate COUNT query so the client still gets an accurate total.
+    """
+    windowed = (
+        stmt.add_columns(func.count().over().label("_total"))
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
+    rows = db.session.execute(windowed).all()
+
+    if rows:
+        width = len(stmt.column_descriptions)
+        if width == 1:
+            return [row[0] for row in rows], rows[0]._total
+        return [tuple(row[:width]) for row in rows], rows[0]._total
+
+    if page == 1:
+        return [], 0
+
+    total = db.session.execute(
+        select(func.count()).select_from(stmt.order_by(None).subquery())
+    ).scalar_one()
+    return [], total
+
+
+def paginate_after(
+    stmt: Select, key: InstrumentedAttribute, after: Any, limit: int
+) -> Tuple[List[Any], Optional[Any]]:
+    """
+    Execute a select for the rows following `after` in `key` order.
+
+    Fetches one row more than requested to know whether another page exists,
+    without counting.
+
+    Args:
+        stmt: A select() of a single ORM entity with filters applied (but no
+            ORDER BY/LIMIT). `key` must be unique and indexed, e.g. the
+            primary key.
+        key: Column to page by, e.g. User.id
+        after: Return rows whose key is greater than this value
+        limit: Maximum number of rows to return
+
+    Returns:
+        Tuple of (list of items, key of the last item or None if this is
+        the last page). Pass the second value as `after` for the next page.
+    """
+    rows = db.session.scalars(stmt.where(key > after).order_by(key).limit(limit + 1)).all()
+
+    if len(rows) > limit:
+        return list(rows[:limit]), getattr(rows[limit - 1], key.key)
+    return list(rows), None
+
+
+def estimated_count(table: Table) -> Optional[int]:
+    """
+    Return PostgreSQL's estimate of the number of rows in a table.
+
+    Reads pg_class.reltuples, which autovacuum/ANALYZE keep roughly up to
+    date - no table scan. Good enough for "about N results" in a UI, never
+    for business logic.
+
+    Args:
+        table: SQLAlchemy Table, e.g. User.__table__
+
+    Returns:
+        Estimated row count, or None if the table has never been analyzed
+    """
+    name = table.name if table.schema is None else f"{table.schema}.{table.name}"
+    estimate = db.session.execute(
+        db.text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": name},
+    ).scalar()
+    return estimate if estimate is not None and estimate >= 0 else None
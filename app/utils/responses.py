@@ -63,9 +63,11 @@ return success_response(
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from flask import Response, jsonify
+from flask import Response, jsonify, request
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.base import CachedSchemaModel
+
 # =============================================================================
 # Error Codes Enum
 # =============================================================================
@@ -171,7 +173,13 @@ class MetaInfo(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
-class StandardSuccessResponse(BaseModel):
+# The response envelopes derive from CachedSchemaModel: nearly every route
+# documents them (StandardErrorResponse alone appears ~30 times), so each
+# model's JSON schema is generated once at startup and copied afterwards.
+# Note: class docstrings become the schema descriptions in the OpenAPI spec.
+
+
+class StandardSuccessResponse(CachedSchemaModel):
     """
     Standard success response schema for OpenAPI documentation.
 
@@ -189,7 +197,7 @@ class StandardSuccessResponse(BaseModel):
     )
 
 
-class StandardErrorResponse(BaseModel):
+class StandardErrorResponse(CachedSchemaModel):
     """
     Standard error response schema for OpenAPI documentation.
     """
@@ -527,3 +535,117 @@ def validation_error_response(
         details=details,
         status_code=422,
     )
+
+
+# =============================================================================
+# Not Found Response Builder
+# =============================================================================
+
+
+def not_found_response(message: str) -> Tuple[Response, int]:
+    """
+    Create a 404 NOT_FOUND error response.
+
+    Shortcut for the most common error in the API, so handlers don't repeat
+    the same code/status pair every time a lookup comes back empty.
+
+    Args:
+        message: Human-readable message, e.g. "User with id=5 not found"
+
+    Returns:
+        Tuple of (Flask Response, 404)
+
+    Example:
+        user = UserService.get_by_id(path.user_id)
+        if not user:
+            return not_found_response(f"User with id={path.user_id} not found")
+    """
+    return error_response(code=ErrorCode.NOT_FOUND, message=message, status_code=404)
+
+
+# =============================================================================
+# Conditional (ETag) Response Builder
+# =============================================================================
+
+
+def conditional_response(
+    result: Tuple[Response, int], etag: Optional[str] = None, private: bool = False
+) -> Tuple[Response, int]:
+    """
+    Add an ETag to a response and answer 304 Not Modified when it still matches.
+
+    Clients that poll a resource (dashboards refreshing /auth/me, admin UIs
+    re-opening a user) send the ETag back in If-None-Match. When nothing
+    changed, they get an empty 304 instead of the full JSON body.
+
+    Args:
+        result: (Response, status_code) from success_response()
+        etag: Weak validator built from what the data depends on, e.g.
+            f"user-{user.id}-{user.updated_at.isoformat()}". If omitted, a
+            hash of the response body is used.
+        private: True for responses that depend on the caller's token. Adds
+            "Vary: Authorization" and "Cache-Control: private" so shared
+            caches never hand one user's data to another.
+
+    Returns:
+        Tuple of (Flask Response, 200 or 304)
+
+    Example:
+        return conditional_response(
+            success_response(data=user_data),
+            etag=f"user-{user.id}-{user.updated_at.isoformat()}",
+        )
+    """
+    response, status_code = result
+    if status_code != 200:
+        return response, status_code
+
+    if etag is None:
+        response.add_etag(weak=True)
+    else:
+        response.set_etag(etag, weak=True)
+
+    # Cached copies must be revalidated (with the ETag) before being reused
+    response.cache_control.no_cache = True
+    if private:
+        response.cache_control.private = True
+        response.vary.add("Authorization")
+
+    response.make_conditional(request)
+    return response, response.status_code
+
+
+# =============================================================================
+# Pagination Metadata Builder
+# =============================================================================
+
+
+def pagination_meta(total: int, page: int, per_page: int, **extra: Any) -> Dict[str, Any]:
+    """
+    Build the standard pagination "meta" dictionary for list endpoints.
+
+    Every paginated endpoint reports the same fields, so the arithmetic lives
+    here once instead of being repeated in each route.
+
+    Args:
+        total: Total number of items across all pages
+        page: Current page number (1-indexed)
+        per_page: Number of items per page
+        **extra: Additional metadata to include (e.g., count, api_version)
+
+    Returns:
+        dict: {"total", "page", "per_page", "total_pages", **extra}
+
+    Example:
+        return success_response(
+            data=users_data,
+            meta=pagination_meta(total, query.page, query.per_page, count=len(users_data)),
+        )
+    """
+    return {
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": (total + per_page - 1) // per_page,  # Ceiling division
+        **extra,
+    }
@@ -125,6 +125,10 @@ class Config:
     SQLALCHEMY_ENGINE_OPTIONS: dict = {
         "pool_pre_ping": True,  # Verify connections before using
         "pool_recycle": 300,  # Recycle connections after 5 minutes
+        # Seconds a request waits for a free connection before failing.
+        # SQLAlchemy's default (30s) lets requests pile up behind an exhausted
+        # pool long after the client has given up.
+        "pool_timeout": get_env_int("DB_POOL_TIMEOUT", 10),
     }
 
     # Build database URI from environment
@@ -146,6 +150,42 @@ class Config:
     # JSON settings
     JSON_SORT_KEYS: bool = False  # Don't sort JSON keys (faster)
 
+    # ==========================================================================
+    # CACHE SETTINGS
+    # ==========================================================================
+
+    # Seconds to cache role/permission lists and each user's effective
+    # permissions in each worker process. Off (0) by default: a change is only
+    # invalidated in the worker that made it, so with N workers a revoked
+    # permission or removed role keeps working on the others for up to this
+    # many seconds. Enable only if that staleness window is acceptable.
+    RBAC_CACHE_TTL: int = get_env_int("RBAC_CACHE_TTL", 0)
+
+    # Seconds to reuse a verified access token's claims instead of decoding
+    # and re-verifying it on every request (0 disables). Never longer than the
+    # token's own expiry; logout/blocklist checks still run on every request.
+    JWT_DECODE_CACHE_TTL: int = get_env_int("JWT_DECODE_CACHE_TTL", 30)
+
+    # Seconds to cache a user's serialized public profile for GET /users/<id>
+    # in each worker process (0 disables). Edits made in another worker show
+    # up once the cached copy expires.
+    USER_CACHE_TTL: int = get_env_int("USER_CACHE_TTL", 10)
+
+    # Seconds to remember a successful email/password check so repeated
+    # logins with the same credentials skip the slow password hash (0
+    # disables). A password change invalidates the entry immediately.
+    CREDENTIAL_CACHE_TTL: int = get_env_int("CREDENTIAL_CACHE_TTL", 120)
+
+    # Seconds to cache each user's token_version (checked against the "tv"
+    # claim on every request; 0 disables). "Logout everywhere" is immediate in
+    # the worker that handled it; other workers notice once their copy expires.
+    TOKEN_VERSION_CACHE_TTL: int = get_env_int("TOKEN_VERSION_CACHE_TTL", 30)
+
+    # Where revoked (logged-out) token IDs are stored. "memory://" keeps them
+    # in each worker process; use "redis://host:6379/0" so every worker sees a
+    # logout and revocations survive restarts (requires the redis package).
+    TOKEN_BLOCKLIST_URL: str = os.environ.get("TOKEN_BLOCKLIST_URL", "memory://")
+
     # ==========================================================================
     # SWAGGER UI SETTINGS
     # ==========================================================================
@@ -247,11 +287,13 @@ class ProductionConfig(Config):
     CORS_CREDENTIALS: bool = get_env_bool("CORS_CREDENTIALS", True)
 
     # Production database pool settings
+    # Each gunicorn worker process has its own pool, so the database sees up to
+    # workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections. Keep that below
+    # PostgreSQL's max_connections (100 by default) when scaling workers.
     SQLALCHEMY_ENGINE_OPTIONS: dict = {
-        "pool_pre_ping": True,
-        "pool_recycle": 300,
-        "pool_size": 10,  # Larger pool for production
-        "max_overflow": 20,  # Allow more connections under load
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
+        "pool_size": get_env_int("DB_POOL_SIZE", 10),  # Larger pool for production
+        "max_overflow": get_env_int("DB_MAX_OVERFLOW", 20),  # More connections under load
     }
 
     @classmethod
@@ -296,6 +338,16 @@ class TestingConfig(Config):
     # Allow all origins in tests
     CORS_ORIGINS: List[str] = ["*"]
 
+    # Tests log in far more often than the auth rate limits allow
+    RATELIMIT_ENABLED: bool = False
+
+    # Disable caching so every test sees the current database state
+    RBAC_CACHE_TTL: int = 0
+    JWT_DECODE_CACHE_TTL: int = 0
+    TOKEN_VERSION_CACHE_TTL: int = 0
+    CREDENTIAL_CACHE_TTL: int = 0
+    USER_CACHE_TTL: int = 0
+
     @classmethod
     def validate(cls) -> List[str]:
         """Testing config is lenient."""
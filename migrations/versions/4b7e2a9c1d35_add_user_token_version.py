@@ -0,0 +1,33 @@
+"""Add users.token_version
+
+Revision ID: 4b7e2a9c1d35
+Revises: 06ffc6d4c520
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4b7e2a9c1d35"
+down_revision = "06ffc6d4c520"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("users", schema="users") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "token_version",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+            )
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("users", schema="users") as batch_op:
+        batch_op.drop_column("token_version")
@@ -10,6 +10,9 @@ Fixtures Provided:
 - client: Flask test client for making HTTP requests
 - db: Database session for direct database access
 - sample_user: A pre-created user for testing
+- auth_headers: Authorization header with a valid access token for sample_user
+- admin_user: A super admin (RBAC permissions and roles seeded)
+- admin_headers: Authorization header with a valid access token for admin_user
 
 Usage:
     def test_something(client, sample_user):
@@ -23,7 +26,9 @@ import pytest
 
 from app import create_app
 from app import db as _db
+from app.auth import create_tokens
 from app.models.user import User
+from app.rbac.services import RBACService
 
 
 @pytest.fixture(scope="session")
@@ -117,10 +122,41 @@ def sample_users(db) -> list:
 
 
 @pytest.fixture
-def auth_headers():
+def auth_headers(sample_user) -> dict:
     """
-    Return authorization headers for authenticated requests.
+    Return authorization headers for requests made as sample_user.
+    """
+    tokens = create_tokens(sample_user)
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+@pytest.fixture(scope="function")
+def admin_user(db) -> User:
+    """
+    Create a super admin user for testing admin endpoints.
+
+    Seeds the default permissions and roles, then assigns "super_admin".
+    """
+    RBACService.seed_all()
+
+    user = User(
+        username="adminuser",
+        email="admin@example.com",
+        first_name="Admin",
+        last_name="User",
+    )
+    user.set_password("AdminPassword123!")
+    db.session.add(user)
+    db.session.commit()
 
-    Note: Implement actual token generation when authentication is added.
+    RBACService.assign_role_to_user(user, "super_admin")
+    return user
+
+
+@pytest.fixture
+def admin_headers(admin_user) -> dict:
+    """
+    Return authorization headers for requests made as admin_user.
     """
-    return {"Authorization": "Bearer test-token"}
+    tokens = create_tokens(admin_user)
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
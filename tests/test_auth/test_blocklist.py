@@ -0,0 +1,168 @@
+"""
+Tests for the Token Blocklist.
+
+These tests verify the revoked-token storage including:
+- Expiry of in-memory entries
+- Skipping tokens that have already expired
+- The Redis backend's commands (against a fake client)
+"""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from app.auth import blocklist as blocklist_module
+from app.auth.blocklist import REVOKED_KEY_PREFIX, MemoryBlocklist, RedisBlocklist, TokenBlocklist
+
+
+class FakeClock:
+    """Stand-in for the time module with a controllable time()."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.Redis commands the blocklist uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.expiry[key] = ex
+        return True
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [key for key in list(self.data) if key.startswith(prefix)]
+
+    def delete(self, key):
+        self.data.pop(key, None)
+        self.expiry.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    """Make redis.Redis.from_url() return a FakeRedis."""
+    client = FakeRedis()
+    redis_module = SimpleNamespace(Redis=SimpleNamespace(from_url=lambda url, **kwargs: client))
+    monkeypatch.setitem(sys.modules, "redis", redis_module)
+    return client
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    """Freeze the blocklist module's clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(blocklist_module, "time", fake)
+    return fake
+
+
+class TestMemoryBlocklist:
+    """Tests for the in-process backend."""
+
+    def test_revoked_until_expiry(self, clock):
+        """Test a token is revoked until its TTL runs out."""
+        backend = MemoryBlocklist()
+        backend.revoke("jti-1", ttl=60)
+
+        clock.now += 59
+        assert backend.is_revoked("jti-1") is True
+
+        clock.now += 1
+        assert backend.is_revoked("jti-1") is False
+
+    def test_expired_entries_purged_on_revoke(self, clock):
+        """Test expired entries are dropped the next time a token is revoked."""
+        backend = MemoryBlocklist()
+        backend.revoke("old", ttl=10)
+
+        clock.now += 20
+        backend.revoke("new", ttl=10)
+
+        assert "old" not in backend._revoked
+        assert backend.is_revoked("new") is True
+
+
+class TestRedisBlocklist:
+    """Tests for the Redis backend."""
+
+    def test_revoke_sets_key_with_ttl(self, fake_redis):
+        """Test revoking writes one prefixed key that expires with the token."""
+        backend = RedisBlocklist("redis://localhost:6379/0")
+        backend.revoke("jti-1", ttl=60)
+
+        key = f"{REVOKED_KEY_PREFIX}jti-1"
+        assert fake_redis.data == {key: b"1"}
+        assert fake_redis.expiry[key] == 60
+        assert backend.is_revoked("jti-1") is True
+        assert backend.is_revoked("jti-2") is False
+
+    def test_revoke_keeps_first_ttl(self, fake_redis):
+        """Test revoking an already-revoked token doesn't extend it (NX)."""
+        backend = RedisBlocklist("redis://localhost:6379/0")
+        backend.revoke("jti-1", ttl=60)
+        backend.revoke("jti-1", ttl=600)
+
+        assert fake_redis.expiry[f"{REVOKED_KEY_PREFIX}jti-1"] == 60
+
+    def test_clear_only_removes_revoked_keys(self, fake_redis):
+        """Test clear() leaves unrelated keys in the same database alone."""
+        fake_redis.set("ratelimit:1.2.3.4", b"5")
+        backend = RedisBlocklist("redis://localhost:6379/0")
+        backend.revoke("jti-1", ttl=60)
+
+        backend.clear()
+
+        assert backend.is_revoked("jti-1") is False
+        assert "ratelimit:1.2.3.4" in fake_redis.data
+
+    def test_selected_by_url(self, fake_redis):
+        """Test init_app() picks the Redis backend for a redis:// URL."""
+        blocklist = TokenBlocklist()
+        blocklist.init_app("redis://localhost:6379/0")
+        blocklist.revoke("jti-1")
+
+        assert blocklist.is_revoked("jti-1") is True
+        assert f"{REVOKED_KEY_PREFIX}jti-1" in fake_redis.data
+
+
+class TestTokenBlocklist:
+    """Tests for the backend facade."""
+
+    def test_revoke_until_exp(self, clock):
+        """Test a token is remembered until its own exp claim."""
+        blocklist = TokenBlocklist()
+        blocklist.revoke("jti-1", expires_at=int(clock.now) + 60)
+
+        assert blocklist.is_revoked("jti-1") is True
+
+        clock.now += 60
+        assert blocklist.is_revoked("jti-1") is False
+
+    def test_revoke_skips_expired_token(self, clock):
+        """Test an already-expired token is not stored at all."""
+        blocklist = TokenBlocklist()
+        blocklist.revoke("jti-1", expires_at=int(clock.now) - 1)
+
+        assert blocklist.is_revoked("jti-1") is False
+        assert blocklist._backend._revoked == {}
+
+    def test_revoke_without_exp(self, clock):
+        """Test a token without exp is remembered for DEFAULT_REVOKE_TTL."""
+        blocklist = TokenBlocklist()
+        blocklist.revoke("jti-1")
+
+        clock.now += blocklist_module.DEFAULT_REVOKE_TTL - 1
+        assert blocklist.is_revoked("jti-1") is True
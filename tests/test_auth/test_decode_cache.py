@@ -0,0 +1,63 @@
+"""
+Tests for the Decoded-Token Cache.
+
+CachingJWTManager overrides a private Flask-JWT-Extended hook, so these tests
+guard against an upgrade that silently stops calling it:
+- Verified claims are cached per token
+- A tampered token is never served from the cache
+- The cache is bypassed when JWT_DECODE_CACHE_TTL is 0
+"""
+
+import pytest
+
+from app.auth import _decoded_token_cache, create_tokens
+
+
+@pytest.fixture
+def decode_cache(app, monkeypatch):
+    """Enable the decode cache and start it empty."""
+    monkeypatch.setitem(app.config, "JWT_DECODE_CACHE_TTL", 30)
+    _decoded_token_cache.clear()
+    yield _decoded_token_cache
+    _decoded_token_cache.clear()
+
+
+def bearer(token: str) -> dict:
+    """Build an Authorization header for a raw token."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestDecodeCache:
+    """Tests for CachingJWTManager._decode_jwt_from_config."""
+
+    def test_hook_caches_verified_token(self, client, sample_user, decode_cache):
+        """Test a request decodes through the override and caches the claims."""
+        token = create_tokens(sample_user)["access_token"]
+
+        first = client.get("/api/v1/auth/me", headers=bearer(token))
+        second = client.get("/api/v1/auth/me", headers=bearer(token))
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert len(decode_cache) == 1
+
+    def test_tampered_token_not_served_from_cache(self, client, sample_user, decode_cache):
+        """Test a token with a different signature is verified and rejected."""
+        token = create_tokens(sample_user)["access_token"]
+        client.get("/api/v1/auth/me", headers=bearer(token))
+
+        tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+        response = client.get("/api/v1/auth/me", headers=bearer(tampered))
+
+        assert response.status_code == 401
+        assert len(decode_cache) == 1
+
+    def test_cache_disabled_with_zero_ttl(self, app, client, sample_user, decode_cache):
+        """Test nothing is cached when JWT_DECODE_CACHE_TTL is 0."""
+        app.config["JWT_DECODE_CACHE_TTL"] = 0
+        token = create_tokens(sample_user)["access_token"]
+
+        response = client.get("/api/v1/auth/me", headers=bearer(token))
+
+        assert response.status_code == 200
+        assert len(decode_cache) == 0
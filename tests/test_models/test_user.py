@@ -5,9 +5,10 @@ These tests verify the User model's functionality including:
 - Password hashing and verification
 - Soft delete functionality
 - Serialization methods
+- Permission matching
 """
 
-from app.models.user import User
+from app.models.user import User, matches_permission
 
 
 class TestUserModel:
@@ -93,3 +94,32 @@ class TestUserModel:
     def test_repr(self, sample_user):
         """Test string representation."""
         assert repr(sample_user) == "<User testuser>"
+
+
+class TestMatchesPermission:
+    """Test suite for permission matching against a granted set."""
+
+    def test_exact_match(self):
+        """Test an exactly granted permission matches."""
+        granted = frozenset({"users:read"})
+
+        assert matches_permission(granted, "users:read") is True
+        assert matches_permission(granted, "users:delete") is False
+
+    def test_resource_wildcard(self):
+        """Test resource:* grants every action on that resource only."""
+        granted = frozenset({"users:*"})
+
+        assert matches_permission(granted, "users:delete") is True
+        assert matches_permission(granted, "roles:delete") is False
+
+    def test_super_admin(self):
+        """Test *:* grants everything."""
+        assert matches_permission(frozenset({"*:*"}), "anything:at_all") is True
+
+    def test_other_wildcard_forms_denied(self):
+        """Test only *:* and resource:* act as wildcards."""
+        assert matches_permission(frozenset({"*:read"}), "users:read") is False
+        assert matches_permission(frozenset({"user*:*"}), "users:read") is False
+        assert matches_permission(frozenset({"*"}), "users:read") is False
+        assert matches_permission(frozenset({"users:*"}), "users") is False
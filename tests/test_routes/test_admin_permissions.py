@@ -0,0 +1,91 @@
+"""
+Tests for Admin Permission Routes.
+
+These tests verify the direct-permission endpoints including:
+- Bulk grants (only newly granted names returned)
+- All-or-nothing behavior for unknown permissions
+- Request validation
+"""
+
+import json
+
+from app.models import user_permissions
+
+
+def direct_permission_count(db, user_id: int) -> int:
+    """Count the direct permission rows stored for a user."""
+    return db.session.query(user_permissions).filter(user_permissions.c.user_id == user_id).count()
+
+
+class TestGrantDirectPermissions:
+    """Tests for POST /api/v1/admin/permissions/users/<id> endpoint."""
+
+    def test_grant_single_permission(self, client, admin_headers, sample_user, db):
+        """Test granting one permission."""
+        response = client.post(
+            f"/api/v1/admin/permissions/users/{sample_user.id}",
+            json={"permission": "users:delete"},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        assert direct_permission_count(db, sample_user.id) == 1
+
+    def test_bulk_grant_returns_only_new_permissions(self, client, admin_headers, sample_user):
+        """Test a bulk grant overlapping existing grants reports only the new ones."""
+        client.post(
+            f"/api/v1/admin/permissions/users/{sample_user.id}",
+            json={"permission": "users:delete"},
+            headers=admin_headers,
+        )
+
+        response = client.post(
+            f"/api/v1/admin/permissions/users/{sample_user.id}",
+            json={"permissions": ["users:delete", "roles:create"]},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["data"]["granted"] == ["roles:create"]
+
+    def test_bulk_grant_unknown_permission(self, client, admin_headers, sample_user, db):
+        """Test a bulk grant with an unknown name returns 404 and grants nothing."""
+        response = client.post(
+            f"/api/v1/admin/permissions/users/{sample_user.id}",
+            json={"permissions": ["users:delete", "reports:export"]},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 404
+        data = json.loads(response.data)
+        assert data["error"]["code"] == "NOT_FOUND"
+        assert direct_permission_count(db, sample_user.id) == 0
+
+    def test_grant_requires_exactly_one_target(self, client, admin_headers, sample_user):
+        """Test sending both or neither of permission/permissions is rejected."""
+        both = client.post(
+            f"/api/v1/admin/permissions/users/{sample_user.id}",
+            json={"permission": "users:delete", "permissions": ["roles:create"]},
+            headers=admin_headers,
+        )
+        neither = client.post(
+            f"/api/v1/admin/permissions/users/{sample_user.id}",
+            json={"reason": "No permission given"},
+            headers=admin_headers,
+        )
+
+        assert both.status_code == 422
+        assert neither.status_code == 422
+
+    def test_bulk_grant_empty_list(self, client, admin_headers, sample_user):
+        """Test an empty permissions list is rejected."""
+        response = client.post(
+            f"/api/v1/admin/permissions/users/{sample_user.id}",
+            json={"permissions": []},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 422
+        data = json.loads(response.data)
+        assert data["error"]["code"] == "VALIDATION_ERROR"
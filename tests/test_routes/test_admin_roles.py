@@ -0,0 +1,56 @@
+"""
+Tests for Admin Role Routes.
+
+These tests verify the role endpoints including:
+- Conditional GET on a user's roles
+- Role updates with unknown permissions
+"""
+
+import json
+
+
+class TestGetUserRoles:
+    """Tests for GET /api/v1/admin/roles/users/<id> endpoint."""
+
+    def test_matching_etag_returns_304(self, client, admin_headers, sample_user):
+        """Test a matching If-None-Match gets an empty 304."""
+        url = f"/api/v1/admin/roles/users/{sample_user.id}"
+        etag = client.get(url, headers=admin_headers).headers["ETag"]
+
+        response = client.get(url, headers={**admin_headers, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+
+    def test_role_change_changes_etag(self, client, admin_headers, sample_user):
+        """Test assigning a role invalidates the previous ETag."""
+        url = f"/api/v1/admin/roles/users/{sample_user.id}"
+        etag = client.get(url, headers=admin_headers).headers["ETag"]
+
+        client.post(url, json={"role_name": "moderator"}, headers=admin_headers)
+        response = client.get(url, headers={**admin_headers, "If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+
+class TestUpdateRole:
+    """Tests for PUT /api/v1/admin/roles/<name> endpoint."""
+
+    def test_update_role_unknown_permission(self, client, admin_headers):
+        """Test an unknown permission returns 404 and leaves the role unchanged."""
+        before = json.loads(client.get("/api/v1/admin/roles/moderator", headers=admin_headers).data)
+
+        response = client.put(
+            "/api/v1/admin/roles/moderator",
+            json={"display_name": "Moderators", "permissions": ["users:read", "reports:export"]},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 404
+        data = json.loads(response.data)
+        assert data["error"]["code"] == "NOT_FOUND"
+
+        after = json.loads(client.get("/api/v1/admin/roles/moderator", headers=admin_headers).data)
+        assert sorted(after["data"]["permissions"]) == sorted(before["data"]["permissions"])
+        assert after["data"]["display_name"] == before["data"]["display_name"]
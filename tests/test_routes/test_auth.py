@@ -0,0 +1,100 @@
+"""
+Tests for Auth Routes.
+
+These tests verify the authentication endpoints including:
+- Logout from all devices
+- Rejection of tokens issued before the logout
+- Conditional GET on /me
+"""
+
+import json
+
+from app.auth import create_tokens
+
+
+def bearer(token: str) -> dict:
+    """Build an Authorization header for a raw token."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestLogoutAll:
+    """Tests for POST /api/v1/auth/logout-all endpoint."""
+
+    def test_logout_all_success(self, client, auth_headers):
+        """Test logging out from all devices."""
+        response = client.post("/api/v1/auth/logout-all", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["success"] is True
+
+    def test_logout_all_requires_token(self, client):
+        """Test logout-all without a token is rejected."""
+        response = client.post("/api/v1/auth/logout-all")
+
+        assert response.status_code == 401
+
+    def test_access_token_rejected_after_logout_all(self, client, sample_user):
+        """Test an access token issued before logout-all no longer works."""
+        tokens = create_tokens(sample_user)
+        me = client.get("/api/v1/auth/me", headers=bearer(tokens["access_token"]))
+        assert me.status_code == 200
+
+        client.post("/api/v1/auth/logout-all", headers=bearer(tokens["access_token"]))
+        response = client.get("/api/v1/auth/me", headers=bearer(tokens["access_token"]))
+
+        assert response.status_code == 401
+        data = json.loads(response.data)
+        assert data["error"]["code"] == "TOKEN_INVALID"
+
+    def test_refresh_token_rejected_after_logout_all(self, client, sample_user):
+        """Test a refresh token issued before logout-all no longer works."""
+        tokens = create_tokens(sample_user)
+
+        client.post("/api/v1/auth/logout-all", headers=bearer(tokens["access_token"]))
+        response = client.post("/api/v1/auth/refresh", headers=bearer(tokens["refresh_token"]))
+
+        assert response.status_code == 401
+
+    def test_login_after_logout_all(self, client, sample_user):
+        """Test a fresh login after logout-all gets working tokens."""
+        tokens = create_tokens(sample_user)
+        client.post("/api/v1/auth/logout-all", headers=bearer(tokens["access_token"]))
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={
+                "email": "test@example.com",
+                "password": "TestPassword123!",
+            },
+            content_type="application/json",
+        )
+        assert response.status_code == 200
+        new_tokens = json.loads(response.data)["data"]
+
+        me = client.get("/api/v1/auth/me", headers=bearer(new_tokens["access_token"]))
+        assert me.status_code == 200
+
+        refreshed = client.post("/api/v1/auth/refresh", headers=bearer(new_tokens["refresh_token"]))
+        assert refreshed.status_code == 200
+
+
+class TestGetMe:
+    """Tests for GET /api/v1/auth/me endpoint."""
+
+    def test_me_is_private(self, client, auth_headers):
+        """Test /me is marked private and varies by Authorization."""
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.cache_control.private is True
+        assert "Authorization" in response.vary
+
+    def test_me_matching_etag_returns_304(self, client, auth_headers):
+        """Test a matching If-None-Match gets an empty 304."""
+        etag = client.get("/api/v1/auth/me", headers=auth_headers).headers["ETag"]
+
+        response = client.get("/api/v1/auth/me", headers={**auth_headers, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
@@ -110,6 +110,31 @@ class TestUserLogin:
         assert data["success"] is True
         assert data["data"]["user"]["username"] == "testuser"
 
+    def test_login_password_with_surrounding_spaces(self, client):
+        """Test a password with leading/trailing spaces is kept as typed."""
+        password = " Passw0rd! "
+        register = client.post(
+            "/api/v1/auth/register",
+            json={
+                "username": "spaceduser",
+                "email": "spaced@example.com",
+                "password": password,
+                "first_name": "Spaced",
+            },
+            content_type="application/json",
+        )
+        assert register.status_code == 201
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": "spaced@example.com", "password": password},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["data"]["user"]["username"] == "spaceduser"
+
     def test_login_invalid_password(self, client, sample_user):
         """Test login with wrong password."""
         response = client.post(
@@ -185,6 +210,82 @@ class TestGetUsers:
         assert data["success"] is False
 
 
+class TestGetUsersCursor:
+    """Tests for keyset pagination (?cursor=) on GET /api/users."""
+
+    def test_cursor_chains_pages(self, client, sample_users):
+        """Test following next_cursor walks through every user once."""
+        first = json.loads(client.get("/api/v1/users/?cursor=0&per_page=2").data)
+        second_url = f"/api/v1/users/?cursor={first['meta']['next_cursor']}&per_page=2"
+        second = json.loads(client.get(second_url).data)
+
+        first_ids = [user["id"] for user in first["data"]]
+        second_ids = [user["id"] for user in second["data"]]
+        assert first_ids == [sample_users[0].id, sample_users[1].id]
+        assert second_ids == [sample_users[2].id, sample_users[3].id]
+        assert first["meta"]["next_cursor"] == sample_users[1].id
+
+    def test_cursor_last_page(self, client, sample_users):
+        """Test the last page has no next_cursor."""
+        response = client.get(f"/api/v1/users/?cursor={sample_users[2].id}&per_page=2")
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert [user["id"] for user in data["data"]] == [sample_users[3].id, sample_users[4].id]
+        assert data["meta"]["next_cursor"] is None
+
+    def test_cursor_skips_deleted(self, client, sample_users, db):
+        """Test soft-deleted users are skipped unless include_deleted is set."""
+        sample_users[1].soft_delete()
+        db.session.commit()
+
+        default = json.loads(client.get("/api/v1/users/?cursor=0").data)
+        with_deleted = json.loads(client.get("/api/v1/users/?cursor=0&include_deleted=true").data)
+
+        assert sample_users[1].id not in [user["id"] for user in default["data"]]
+        assert len(default["data"]) == 4
+        assert sample_users[1].id in [user["id"] for user in with_deleted["data"]]
+        assert len(with_deleted["data"]) == 5
+
+    def test_cursor_negative(self, client):
+        """Test a negative cursor is rejected."""
+        response = client.get("/api/v1/users/?cursor=-1")
+
+        assert response.status_code == 422
+
+
+class TestGetUserETag:
+    """Tests for conditional GET (ETag / If-None-Match) on /api/users/<id>."""
+
+    def test_matching_etag_returns_304(self, client, sample_user):
+        """Test a matching If-None-Match gets an empty 304."""
+        etag = client.get(f"/api/v1/users/{sample_user.id}").headers["ETag"]
+
+        response = client.get(f"/api/v1/users/{sample_user.id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+
+    def test_update_changes_etag(self, client, sample_user, auth_headers):
+        """Test updating the user invalidates the previous ETag."""
+        etag = client.get(f"/api/v1/users/{sample_user.id}").headers["ETag"]
+
+        update = client.put(
+            f"/api/v1/users/{sample_user.id}",
+            json={"bio": "Updated bio"},
+            headers=auth_headers,
+            content_type="application/json",
+        )
+        assert update.status_code == 200
+
+        response = client.get(f"/api/v1/users/{sample_user.id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        data = json.loads(response.data)
+        assert data["data"]["bio"] == "Updated bio"
+
+
 class TestUpdateUser:
     """Tests for PUT /api/users/<id> endpoint."""
 
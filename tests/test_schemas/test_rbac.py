@@ -0,0 +1,37 @@
+"""
+Tests for RBAC Schemas.
+
+These tests verify role-name validation including:
+- Normalization to lowercase
+- Rejection of separator-only and punctuated names
+- Acceptance of the same non-ASCII letters as str.isalnum()
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.rbac import RoleCreateSchema
+
+
+def make_role(name: str) -> RoleCreateSchema:
+    """Build a RoleCreateSchema with the given name."""
+    return RoleCreateSchema(name=name, display_name="Some Role")
+
+
+class TestRoleName:
+    """Tests for RoleCreateSchema.validate_name."""
+
+    @pytest.mark.parametrize("name", ["editor", "report_viewer", "_internal", "tier2", "rôle"])
+    def test_valid_names(self, name):
+        """Test names made of letters, digits and underscores are accepted."""
+        assert make_role(name).name == name
+
+    def test_name_is_normalized(self):
+        """Test surrounding whitespace is stripped and the name lowercased."""
+        assert make_role("  Editor ").name == "editor"
+
+    @pytest.mark.parametrize("name", ["___", "bad-name", "bad name", "bad:name"])
+    def test_invalid_names(self, name):
+        """Test separator-only and punctuated names are rejected."""
+        with pytest.raises(ValidationError):
+            make_role(name)
@@ -3,20 +3,26 @@ Tests for User Service.
 
 These tests verify the UserService business logic including:
 - User creation
-- User authentication
+- User authentication (including the verified-credential cache)
 - User retrieval and listing
 - User updates and deletion
 - Error handling
 """
 
+from types import SimpleNamespace
+
 import pytest
+from sqlalchemy.exc import IntegrityError
 
+from app.models.user import User
 from app.schemas.user import UserCreateSchema, UserUpdateSchema
 from app.services.user_service import (
     InvalidCredentialsError,
     UserAlreadyExistsError,
     UserNotFoundError,
     UserService,
+    _duplicate_field,
+    credential_cache,
 )
 
 
@@ -68,6 +74,54 @@ class TestUserServiceCreate:
 
         assert exc_info.value.field == "email"
 
+    def test_create_user_duplicate_reports_value(self, db, sample_user):
+        """Test the duplicate error names the field and the rejected value."""
+        data = UserCreateSchema(
+            username="testuser",
+            email="other@example.com",
+            password="SecurePass123!",
+            first_name="Test",
+        )
+
+        with pytest.raises(UserAlreadyExistsError) as exc_info:
+            UserService.create_user(data)
+
+        assert exc_info.value.field == "username"
+        assert exc_info.value.value == "testuser"
+        assert UserService.get_by_email("other@example.com") is None
+
+
+class TestDuplicateField:
+    """Tests for mapping an IntegrityError to the duplicated field."""
+
+    @staticmethod
+    def integrity_error(orig) -> IntegrityError:
+        return IntegrityError("INSERT INTO users.users ...", {}, orig)
+
+    def test_constraint_name_username(self):
+        """Test a unique-index violation on username."""
+        orig = SimpleNamespace(diag=SimpleNamespace(constraint_name="ix_users_users_username"))
+
+        assert _duplicate_field(self.integrity_error(orig)) == "username"
+
+    def test_constraint_name_email(self):
+        """Test a unique-index violation on email."""
+        orig = SimpleNamespace(diag=SimpleNamespace(constraint_name="ix_users_users_email"))
+
+        assert _duplicate_field(self.integrity_error(orig)) == "email"
+
+    def test_message_fallback(self):
+        """Test drivers without diag fall back to the error message."""
+        orig = Exception("UNIQUE constraint failed: users.email")
+
+        assert _duplicate_field(self.integrity_error(orig)) == "email"
+
+    def test_not_a_duplicate(self):
+        """Test a NOT NULL violation mentioning the column is not a duplicate."""
+        orig = Exception('null value in column "email" violates not-null constraint')
+
+        assert _duplicate_field(self.integrity_error(orig)) is None
+
 
 class TestUserServiceAuthentication:
     """Tests for user authentication service."""
@@ -89,6 +143,58 @@ class TestUserServiceAuthentication:
             UserService.authenticate("nobody@example.com", "AnyPassword123!")
 
 
+class TestUserServiceCredentialCache:
+    """Tests for the verified-credential cache used by authenticate()."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, app, monkeypatch):
+        """Turn the cache on (it is disabled in TestingConfig) and start empty."""
+        monkeypatch.setitem(app.config, "CREDENTIAL_CACHE_TTL", 120)
+        credential_cache.clear()
+        yield
+        credential_cache.clear()
+
+    @pytest.fixture
+    def hash_checks(self, monkeypatch) -> list:
+        """Record every real password hash check."""
+        calls = []
+        check_password = User.check_password
+
+        def spy(user, password):
+            calls.append(password)
+            return check_password(user, password)
+
+        monkeypatch.setattr(User, "check_password", spy)
+        return calls
+
+    def test_repeat_login_skips_hash(self, db, sample_user, hash_checks):
+        """Test a repeated successful login is served from the cache."""
+        UserService.authenticate("test@example.com", "TestPassword123!")
+        UserService.authenticate("test@example.com", "TestPassword123!")
+
+        assert len(hash_checks) == 1
+
+    def test_old_password_refused_after_change(self, db, sample_user):
+        """Test a cached login stops working once the password changes."""
+        UserService.authenticate("test@example.com", "TestPassword123!")
+
+        sample_user.set_password("NewPassword456!")
+        db.session.commit()
+
+        with pytest.raises(InvalidCredentialsError):
+            UserService.authenticate("test@example.com", "TestPassword123!")
+        assert UserService.authenticate("test@example.com", "NewPassword456!").id == sample_user.id
+
+    def test_failed_attempts_not_cached(self, db, sample_user, hash_checks):
+        """Test wrong passwords are never cached and always pay the full hash."""
+        for _ in range(2):
+            with pytest.raises(InvalidCredentialsError):
+                UserService.authenticate("test@example.com", "WrongPassword123!")
+
+        assert len(hash_checks) == 2
+        assert len(credential_cache) == 0
+
+
 class TestUserServiceRead:
     """Tests for user retrieval services."""
 